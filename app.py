@@ -20,8 +20,8 @@ from datetime import datetime
 import io
 
 from src.auth import Auth
-from src.predictor import Predictor
-from src.disease_remedies import DiseaseRemedyService, RemedyStep
+from src.predictor import Predictor, get_predictor
+from src.disease_remedies import RemedyStep, get_remedy_service
 from bot_run import render_support_bot
 
 try:
@@ -616,6 +616,16 @@ def apply_custom_css():
         """, unsafe_allow_html=True)
 
 
+@st.cache_resource(show_spinner="Loading model...")
+def load_predictor():
+    """
+    Load the model once per server process.
+    
+    SRP: Only caches the predictor across reruns and sessions.
+    """
+    return get_predictor()
+
+
 def get_disease_information(disease_name):
     """Get detailed disease information."""
     disease_data = {
@@ -1167,7 +1177,7 @@ class PredictionPageComponent:
         st.markdown("## 🏥 Complete Disease Treatment & Cure Guide")
         
         # Get remedy information
-        remedy_service = DiseaseRemedyService()
+        remedy_service = get_remedy_service()
         remedy = remedy_service.get_remedy(predicted_class)
         
         if remedy:
@@ -1298,7 +1308,7 @@ class CureGuidePageComponent:
         # Disease Selection
         st.markdown("### 🔍 Select a Disease")
         
-        remedy_service = DiseaseRemedyService()
+        remedy_service = get_remedy_service()
         available_diseases = remedy_service.get_all_diseases()
         
         if not available_diseases:
@@ -1644,10 +1654,7 @@ class Application:
             # Lazy load predictor
             if self.predictor is None:
                 try:
-                    if 'predictor' not in st.session_state:
-                        with st.spinner("Loading model..."):
-                            st.session_state.predictor = Predictor()
-                    self.predictor = st.session_state.predictor
+                    self.predictor = load_predictor()
                     
                     prediction_page = PredictionPageComponent(self.predictor)
                     prediction_page.render()
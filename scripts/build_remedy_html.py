@@ -0,0 +1,28 @@
+"""
+Pre-build the remedy HTML pages served by get_remedy_html.
+
+Writes one data/remedies/<disease>.html file per disease in the remedy
+database. Re-run this script after editing src/disease_remedies.py.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.disease_remedies import DiseaseRemedyService, REMEDY_HTML_DIR, render_remedy_html
+
+
+def build_remedy_html(output_dir=REMEDY_HTML_DIR):
+    """Render every disease's remedy HTML into output_dir."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    for disease_name in DiseaseRemedyService().get_all_diseases():
+        html_path = output_dir / f"{disease_name}.html"
+        html_path.write_text(render_remedy_html(disease_name), encoding='utf-8')
+        print(f"Wrote {html_path}")
+
+
+if __name__ == "__main__":
+    build_remedy_html()
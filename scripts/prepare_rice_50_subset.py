@@ -3,10 +3,24 @@ Prepare a subset of rice leaf dataset with 3 classes of 50 images each
 """
 import os
 import shutil
-import random
 from pathlib import Path
 
-def prepare_rice_50_subset():
+import numpy as np
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+def _fast_copy(src, dst):
+    """Hardlink src to dst (metadata only), falling back to a real copy."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device or unsupported filesystem
+        shutil.copy2(src, dst)
+
+def prepare_rice_50_subset(seed=42):
+    # Seeded generator for reproducible selection
+    rng = np.random.default_rng(seed)
+    
     # Source directory
     source_dir = Path("datasets/praveen_kumar_reddy/rice_leaf")
     
@@ -31,20 +45,22 @@ def prepare_rice_50_subset():
     for class_name in selected_classes:
         source_class_dir = source_dir / class_name
         
-        # Get all images from this class
-        image_files = list(source_class_dir.glob("*.jpg")) + \
-                     list(source_class_dir.glob("*.jpeg")) + \
-                     list(source_class_dir.glob("*.png")) + \
-                     list(source_class_dir.glob("*.JPG"))
+        # Get all images from this class in a single directory pass
+        # (sorted, since scandir order is filesystem-dependent and the seeded
+        # sample below must pick the same images on every machine)
+        with os.scandir(source_class_dir) as entries:
+            image_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS)
+            )
         
         print(f"\n{class_name}: Found {len(image_files)} images")
         
         # Randomly select 50 images
-        if len(image_files) >= 50:
-            selected_images = random.sample(image_files, 50)
-        else:
+        if len(image_files) < 50:
             print(f"Warning: Only {len(image_files)} images available for {class_name}")
-            selected_images = image_files
+        idx = rng.choice(len(image_files), size=min(50, len(image_files)), replace=False)
+        selected_images = [image_files[i] for i in idx]
         
         # Split: 35 train, 8 val, 7 test
         train_images = selected_images[:35]
@@ -56,13 +72,13 @@ def prepare_rice_50_subset():
         (val_dir / class_name).mkdir(parents=True, exist_ok=True)
         (test_dir / class_name).mkdir(parents=True, exist_ok=True)
         
-        # Copy images
+        # Link images into the subset (source images are never modified)
         for img in train_images:
-            shutil.copy2(img, train_dir / class_name / img.name)
+            _fast_copy(img, train_dir / class_name / img.name)
         for img in val_images:
-            shutil.copy2(img, val_dir / class_name / img.name)
+            _fast_copy(img, val_dir / class_name / img.name)
         for img in test_images:
-            shutil.copy2(img, test_dir / class_name / img.name)
+            _fast_copy(img, test_dir / class_name / img.name)
         
         print(f"  Train: {len(train_images)}, Val: {len(val_images)}, Test: {len(test_images)}")
     
@@ -80,5 +96,4 @@ def prepare_rice_50_subset():
     return target_dir
 
 if __name__ == "__main__":
-    random.seed(42)  # For reproducibility
-    prepare_rice_50_subset()
+    prepare_rice_50_subset(seed=42)  # For reproducibility
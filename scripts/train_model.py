@@ -155,6 +155,13 @@ def validate(model, dataloader, criterion, device):
     return epoch_loss, epoch_acc
 
 
+def save_checkpoint(obj, path):
+    """Save a checkpoint through a temporary file and an atomic rename."""
+    tmp_path = Path(path).with_suffix(f'.tmp{os.getpid()}')
+    torch.save(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+
 def plot_training_history(history, save_path):
     """Plot and save training history."""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
@@ -314,7 +321,7 @@ def train_model():
         # Save best model
         if val_acc > best_val_acc:
             best_val_acc = val_acc
-            torch.save(model.state_dict(), best_model_path)
+            save_checkpoint(model.state_dict(), best_model_path)
             print(f"  ✓ New best model saved! (Val Acc: {val_acc:.4f})")
     
     total_time = time.time() - start_time
@@ -327,7 +334,7 @@ def train_model():
     
     # Save final model
     final_model_path = base_dir / config['model']['model_path']
-    torch.save(model.state_dict(), final_model_path)
+    save_checkpoint(model.state_dict(), final_model_path)
     print(f"\nFinal model saved to: {final_model_path}")
     print(f"Best model saved to: {best_model_path}")
     
@@ -6,17 +6,21 @@ This script uses a pre-trained ResNet18 model for better accuracy on small datas
 
 import sys
 import os
+import argparse
 import json
 import time
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
 import torch
+import torch.distributed as dist
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import Dataset, DataLoader
+from torch.nn.parallel import DistributedDataParallel as DDP
+from torch.utils.data import Dataset, DataLoader, TensorDataset
+from torch.utils.data.distributed import DistributedSampler
 from PIL import Image
-import matplotlib.pyplot as plt
 import torchvision.models as models
 
 # Add src to path
@@ -24,47 +28,224 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.transforms import ImageTransformer
 
+# orjson is optional; fall back to the standard library parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
 
 class RiceLeafDataset(Dataset):
     """Dataset class for rice leaf disease images."""
     
-    def __init__(self, root_dir, transform=None):
+    def __init__(self, root_dir, transform=None, decode_size=None):
         """
         Args:
             root_dir (str): Directory with disease class subdirectories
             transform (callable, optional): Optional transform to be applied on images
+            decode_size (tuple, optional): Smallest (height, width) needed by the
+                transform; lets the JPEG decoder downscale while decoding.
+                Only suitable for transforms that resize the whole image
         """
         self.root_dir = Path(root_dir)
         self.transform = transform
+        self.decode_size = decode_size
         
         # Get class names from subdirectories
         self.classes = sorted([d.name for d in self.root_dir.iterdir() if d.is_dir()])
         self.class_to_idx = {cls_name: idx for idx, cls_name in enumerate(self.classes)}
         
-        # Collect all image paths and labels
-        self.samples = []
+        # Collect image paths and labels as parallel arrays
+        paths = []
+        labels = []
         for class_name in self.classes:
             class_dir = self.root_dir / class_name
-            for img_path in class_dir.glob('*.jpg'):
-                self.samples.append((str(img_path), self.class_to_idx[class_name]))
-            for img_path in class_dir.glob('*.JPG'):
-                self.samples.append((str(img_path), self.class_to_idx[class_name]))
-            for img_path in class_dir.glob('*.jpeg'):
-                self.samples.append((str(img_path), self.class_to_idx[class_name]))
-            for img_path in class_dir.glob('*.png'):
-                self.samples.append((str(img_path), self.class_to_idx[class_name]))
+            class_idx = self.class_to_idx[class_name]
+            # Single directory pass instead of one glob per extension
+            with os.scandir(class_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                        paths.append(entry.path)
+                        labels.append(class_idx)
+        
+        self.image_paths = paths
+        self.labels = np.asarray(labels, dtype=np.int64)
     
     def __len__(self):
-        return len(self.samples)
+        return len(self.image_paths)
     
     def __getitem__(self, idx):
-        img_path, label = self.samples[idx]
-        image = Image.open(img_path).convert('RGB')
+        return self._load_image(self.image_paths[idx]), int(self.labels[idx])
+    
+    def __getitems__(self, indices):
+        """Batched fetch used by DataLoader (PyTorch >= 2.0)."""
+        labels = self.labels[indices].tolist()
+        return [(self._load_image(self.image_paths[i]), label) for i, label in zip(indices, labels)]
+    
+    def _load_image(self, img_path):
+        """Decode an image file and apply the transform."""
+        image = Image.open(img_path)
+        if self.decode_size:
+            # libjpeg DCT scaling: decode large JPEGs straight to a reduced
+            # size that is still >= decode_size (no-op for other formats)
+            image.draft('RGB', self.decode_size[::-1])
+        image = image.convert('RGB')
         
         if self.transform:
             image = self.transform(image)
         
-        return image, label
+        return image
+
+
+class PrecachedDataset(Dataset):
+    """Dataset over images that were decoded and preprocessed ahead of time."""
+    
+    def __init__(self, images, labels, classes, transform=None):
+        """
+        Args:
+            images (Tensor): Preprocessed images of shape (N, C, H, W)
+            labels (Tensor): Class indices of shape (N,)
+            classes (list): Class names, indexed by label
+            transform (callable, optional): Tensor-side augmentation
+        """
+        self.images = images
+        self.labels = labels
+        self.classes = classes
+        self.transform = transform
+    
+    def __len__(self):
+        return len(self.labels)
+    
+    def __getitem__(self, idx):
+        image = self.images[idx].float()
+        if self.transform:
+            image = self.transform(image)
+        return image, int(self.labels[idx])
+
+
+class FrozenBackboneClassifier(nn.Module):
+    """
+    Classifier whose feature extractor is frozen.
+    
+    The backbone runs under torch.no_grad() so autograd only records the
+    head; backward then touches nothing but the classifier parameters.
+    """
+    
+    def __init__(self, backbone, head):
+        super().__init__()
+        self.backbone = backbone
+        self.head = head
+    
+    def forward(self, x):
+        with torch.no_grad():
+            features = self.backbone(x).flatten(1)
+        return self.head(features)
+
+
+def load_precached_dataset(root_dir, preprocess, decode_size=None, transform=None):
+    """
+    Load preprocessed image tensors for a split, building the cache if needed.
+    
+    Images are decoded and run through `preprocess` once, stacked into a
+    float16 tensor and saved next to the split directory as
+    ``<split>_tensors.pt``. The cache is rebuilt when the image listing changes.
+    
+    Args:
+        root_dir (Path): Split directory with class subdirectories
+        preprocess (callable): Deterministic transform applied before caching
+        decode_size (tuple, optional): Passed through to RiceLeafDataset
+        transform (callable, optional): Augmentation applied per sample at load time
+    
+    Returns:
+        PrecachedDataset backed by the (memory-mapped) cache file
+    """
+    root_dir = Path(root_dir)
+    source = RiceLeafDataset(root_dir, transform=preprocess, decode_size=decode_size)
+    cache_path = root_dir.with_name(f'{root_dir.name}_tensors.pt')
+    paths = [os.path.relpath(p, root_dir) for p in source.image_paths]
+    
+    cache = None
+    if cache_path.exists():
+        cache = torch.load(cache_path, mmap=True, weights_only=True)
+        if cache['paths'] != paths or cache['classes'] != source.classes:
+            cache = None
+    
+    if cache is None:
+        print(f"Preprocessing {len(source)} images into {cache_path}...")
+        images = None
+        for idx in range(len(source)):
+            image = source[idx][0]
+            if images is None:
+                images = torch.empty((len(source), *image.shape), dtype=torch.float16)
+            images[idx] = image
+        cache = {
+            'images': images,
+            'labels': torch.from_numpy(source.labels),
+            'paths': paths,
+            'classes': source.classes
+        }
+        # Write atomically so concurrent ranks never read a partial file
+        save_checkpoint(cache, cache_path)
+    
+    return PrecachedDataset(cache['images'], cache['labels'], source.classes, transform=transform)
+
+
+def save_checkpoint(obj, path):
+    """
+    Save a checkpoint atomically.
+    
+    Writes to a temporary file and renames it over path, so a process that
+    has the old checkpoint loaded or memory-mapped never sees it rewritten.
+    """
+    path = Path(path)
+    tmp_path = path.with_suffix(f'.tmp{os.getpid()}')
+    torch.save(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_json(path):
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_json(data, path):
+    """Write indented JSON to a file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def setup_distributed():
+    """
+    Initialize torch.distributed when launched with torchrun (WORLD_SIZE > 1).
+    
+    Returns:
+        Tuple of (device, local_rank, is_main). local_rank is None for
+        single-device runs.
+    """
+    if int(os.environ.get('WORLD_SIZE', '1')) <= 1:
+        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        return device, None, True
+    
+    local_rank = int(os.environ['LOCAL_RANK'])
+    if torch.cuda.is_available():
+        dist.init_process_group('nccl')
+        torch.cuda.set_device(local_rank)
+        device = torch.device('cuda', local_rank)
+    else:
+        dist.init_process_group('gloo')
+        device = torch.device('cpu')
+    
+    return device, local_rank, dist.get_rank() == 0
 
 
 def get_image_transformer(config):
@@ -77,37 +258,73 @@ def get_image_transformer(config):
     )
 
 
-def train_epoch(model, dataloader, criterion, optimizer, device):
-    """Train for one epoch."""
+def extract_features(backbone, dataloader, device, views=1):
+    """
+    Run the frozen backbone once over a dataloader and cache its features.
+    
+    Args:
+        backbone: Feature extractor (ResNet18 without its classifier)
+        dataloader: DataLoader yielding (images, labels)
+        device: Computation device
+        views (int): Number of passes over the data; use >1 with a random
+            transform to cache several augmented views per image
+    
+    Returns:
+        TensorDataset of (features, labels) kept on the CPU
+    """
+    backbone.eval()
+    use_amp = device.type == 'cuda'
+    features, targets = [], []
+    
+    with torch.no_grad():
+        for _ in range(views):
+            for inputs, labels in dataloader:
+                inputs = inputs.to(device)
+                with torch.autocast(device_type=device.type, dtype=torch.float16, enabled=use_amp):
+                    feats = backbone(inputs).flatten(1)
+                features.append(feats.float().cpu())
+                targets.append(labels)
+    
+    return TensorDataset(torch.cat(features), torch.cat(targets))
+
+
+def train_epoch(model, dataloader, criterion, optimizer, device, scaler):
+    """Train for one epoch (mixed precision on CUDA)."""
     model.train()
-    running_loss = 0.0
-    correct = 0
+    # Accumulate on the device so there is one host sync per epoch, not per batch
+    running_loss = torch.zeros((), device=device)
+    correct = torch.zeros((), device=device, dtype=torch.long)
     total = 0
+    use_amp = device.type == 'cuda'
     
     for inputs, labels in dataloader:
         inputs, labels = inputs.to(device), labels.to(device)
         
-        # Zero gradients
-        optimizer.zero_grad()
+        # Zero gradients (drop the tensors instead of writing zeros)
+        optimizer.zero_grad(set_to_none=True)
         
         # Forward pass
-        outputs = model(inputs)
-        loss = criterion(outputs, labels)
+        with torch.autocast(device_type=device.type, dtype=torch.float16, enabled=use_amp):
+            outputs = model(inputs)
+            loss = criterion(outputs, labels)
         
         # Backward pass and optimize
-        loss.backward()
+        scaler.scale(loss).backward()
+        # Unscale before clipping so the norm is computed on real gradients
+        scaler.unscale_(optimizer)
         # Gradient clipping for stability
         torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
-        optimizer.step()
+        scaler.step(optimizer)
+        scaler.update()
         
         # Statistics
-        running_loss += loss.item() * inputs.size(0)
+        running_loss += loss.detach() * inputs.size(0)
         _, predicted = torch.max(outputs, 1)
         total += labels.size(0)
-        correct += (predicted == labels).sum().item()
+        correct += (predicted == labels).sum()
     
-    epoch_loss = running_loss / total
-    epoch_acc = correct / total
+    epoch_loss = (running_loss / total).item()
+    epoch_acc = correct.item() / total
     
     return epoch_loss, epoch_acc
 
@@ -115,32 +332,41 @@ def train_epoch(model, dataloader, criterion, optimizer, device):
 def validate(model, dataloader, criterion, device):
     """Validate the model."""
     model.eval()
-    running_loss = 0.0
-    correct = 0
     total = 0
+    use_amp = device.type == 'cuda'
     
-    with torch.no_grad():
+    with torch.inference_mode():
+        # Accumulate on the device so there is one host sync per epoch, not per batch
+        running_loss = torch.zeros((), device=device)
+        correct = torch.zeros((), device=device, dtype=torch.long)
+        
         for inputs, labels in dataloader:
             inputs, labels = inputs.to(device), labels.to(device)
             
             # Forward pass
-            outputs = model(inputs)
-            loss = criterion(outputs, labels)
+            with torch.autocast(device_type=device.type, dtype=torch.float16, enabled=use_amp):
+                outputs = model(inputs)
+                loss = criterion(outputs, labels)
             
             # Statistics
-            running_loss += loss.item() * inputs.size(0)
+            running_loss += loss * inputs.size(0)
             _, predicted = torch.max(outputs, 1)
             total += labels.size(0)
-            correct += (predicted == labels).sum().item()
+            correct += (predicted == labels).sum()
     
-    epoch_loss = running_loss / total
-    epoch_acc = correct / total
+    epoch_loss = (running_loss / total).item()
+    epoch_acc = correct.item() / total
     
     return epoch_loss, epoch_acc
 
 
 def save_training_plot(history, save_path):
     """Save training history plots."""
+    # Imported lazily (and without a GUI backend) to keep script startup fast
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
     
     # Plot loss
@@ -166,31 +392,54 @@ def save_training_plot(history, save_path):
     print(f"Training history plot saved to: {save_path}")
 
 
-def train_model():
-    """Main training function with transfer learning."""
+def train_model(cache_features=False, cache_views=1, compile_model=False, precache=False):
+    """
+    Main training function with transfer learning.
+    
+    Runs DistributedDataParallel when launched with
+    ``torchrun --nproc_per_node=N``; only rank 0 logs and writes files.
+    
+    Args:
+        cache_features (bool): Pre-compute frozen backbone features once and
+            train only the classifier head on them
+        cache_views (int): Augmented views cached per training image when
+            cache_features is set (1 disables augmentation)
+        compile_model (bool): Run the full-model forward through torch.compile
+        precache (bool): Decode and preprocess images once into a tensor cache
+            file; only tensor-side augmentation runs during training
+    """
+    
+    # Device configuration (one process per device under torchrun)
+    device, local_rank, is_main = setup_distributed()
+    distributed = local_rank is not None
+    
+    def log(*args):
+        if is_main:
+            print(*args)
     
     # Load configuration
     base_dir = Path(__file__).parent.parent
     config_path = base_dir / 'config' / 'model_config.json'
     
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    config = load_json(config_path)
     
-    print("=" * 60)
-    print("Crop Disease Classifier - Transfer Learning Training")
-    print("=" * 60)
+    log("=" * 60)
+    log("Crop Disease Classifier - Transfer Learning Training")
+    log("=" * 60)
     
     # Training hyperparameters - Optimized for small dataset
     BATCH_SIZE = 16
     NUM_EPOCHS = 30
     LEARNING_RATE = 0.001
     
-    # Device configuration
-    device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-    print(f"\nDevice: {device}")
+    log(f"\nDevice: {device}")
+    if distributed:
+        log(f"Distributed training: {dist.get_world_size()} processes")
+    # Input shape is fixed, so let cuDNN pick the fastest conv algorithms once
+    torch.backends.cudnn.benchmark = True
     
     # Load dataset
-    print("\nLoading dataset...")
+    log("\nLoading dataset...")
     dataset_path = base_dir / 'datasets' / 'rice_leaf_subset' / 'train'
     val_dataset_path = base_dir / 'datasets' / 'rice_leaf_subset' / 'val'
     
@@ -202,19 +451,34 @@ def train_model():
     val_transform = image_transformer.get_inference_transforms()
     
     # Create train and validation datasets
-    train_dataset = RiceLeafDataset(dataset_path, transform=train_transform)
-    val_dataset = RiceLeafDataset(val_dataset_path, transform=val_transform)
-    
-    print(f"Training samples: {len(train_dataset)}")
-    print(f"Validation samples: {len(val_dataset)}")
-    print(f"Classes: {train_dataset.classes}")
-    print(f"Number of classes: {len(train_dataset.classes)}")
-    
-    # Create data loaders
+    # A single cached view is only meaningful without random augmentation
+    if cache_features and cache_views == 1:
+        train_transform = val_transform
+    decode_size = image_transformer.target_size
+    if precache:
+        # Decode/resize/normalize once; the cache is loaded memory-mapped
+        augment = None if train_transform is val_transform else image_transformer.get_tensor_augmentations()
+        train_dataset = load_precached_dataset(dataset_path, val_transform, decode_size, transform=augment)
+        val_dataset = load_precached_dataset(val_dataset_path, val_transform, decode_size)
+    else:
+        # RandomResizedCrop zooms into a sub-region, so a reduced decode would
+        # upsample crops that inference sees at full resolution
+        train_decode_size = decode_size if train_transform is val_transform else None
+        train_dataset = RiceLeafDataset(dataset_path, transform=train_transform, decode_size=train_decode_size)
+        val_dataset = RiceLeafDataset(val_dataset_path, transform=val_transform, decode_size=decode_size)
+    
+    log(f"Training samples: {len(train_dataset)}")
+    log(f"Validation samples: {len(val_dataset)}")
+    log(f"Classes: {train_dataset.classes}")
+    log(f"Number of classes: {len(train_dataset.classes)}")
+    
+    # Create data loaders (each process sees its own shard under DDP)
+    train_sampler = DistributedSampler(train_dataset, shuffle=True) if distributed else None
     train_loader = DataLoader(
         train_dataset,
         batch_size=BATCH_SIZE,
-        shuffle=True,
+        shuffle=train_sampler is None,
+        sampler=train_sampler,
         num_workers=0,
         pin_memory=False
     )
@@ -228,7 +492,7 @@ def train_model():
     )
     
     # Initialize model with transfer learning
-    print("\nInitializing ResNet18 model with transfer learning...")
+    log("\nInitializing ResNet18 model with transfer learning...")
     num_classes = len(train_dataset.classes)
     
     # Load pre-trained ResNet18
@@ -250,7 +514,7 @@ def train_model():
     # Count trainable parameters
     trainable_params = sum(p.numel() for p in model.parameters() if p.requires_grad)
     total_params = sum(p.numel() for p in model.parameters())
-    print(f"Trainable parameters: {trainable_params:,} / {total_params:,}")
+    log(f"Trainable parameters: {trainable_params:,} / {total_params:,}")
     
     # Loss function and optimizer
     criterion = nn.CrossEntropyLoss()
@@ -258,6 +522,37 @@ def train_model():
     optimizer = optim.Adam(model.fc.parameters(), lr=LEARNING_RATE, weight_decay=1e-4)
     # Learning rate scheduling
     scheduler = optim.lr_scheduler.StepLR(optimizer, step_size=10, gamma=0.1)
+    # Gradient scaler for mixed precision (no-op on CPU)
+    scaler = torch.amp.GradScaler('cuda', enabled=device.type == 'cuda')
+    
+    # Only model.fc is trainable, so keep the backbone out of the autograd graph
+    backbone = nn.Sequential(*list(model.children())[:-1])
+    train_module = FrozenBackboneClassifier(backbone, model.fc)
+    
+    # The backbone is frozen, so its features only need computing once
+    if cache_features:
+        log("\nCaching backbone features...")
+        train_features = extract_features(backbone, train_loader, device, views=cache_views)
+        val_features = extract_features(backbone, val_loader, device)
+        train_loader = DataLoader(train_features, batch_size=BATCH_SIZE, shuffle=True)
+        val_loader = DataLoader(val_features, batch_size=BATCH_SIZE, shuffle=False)
+        train_module = model.fc
+        log(f"Cached {len(train_features)} train / {len(val_features)} val feature vectors")
+    
+    if distributed:
+        train_module = DDP(
+            train_module,
+            device_ids=[local_rank] if device.type == 'cuda' else None,
+            bucket_cap_mb=25,
+            gradient_as_bucket_view=True
+        )
+    
+    if compile_model and not cache_features and hasattr(torch, 'compile'):
+        # Checkpoints are still saved from the eager `model`, so state_dict keys
+        # are unaffected by the compiled wrapper
+        log("\nCompiling model with torch.compile...")
+        torch._dynamo.config.cache_size_limit = 64
+        train_module = torch.compile(train_module, mode='reduce-overhead', dynamic=False)
     
     # Training history
     history = {
@@ -270,20 +565,22 @@ def train_model():
     best_val_acc = 0.0
     best_model_path = base_dir / 'models' / 'best_model.pth'
     
-    print("\n" + "=" * 60)
-    print("Starting training...")
-    print("=" * 60)
+    log("\n" + "=" * 60)
+    log("Starting training...")
+    log("=" * 60)
     
     start_time = time.time()
     
     for epoch in range(NUM_EPOCHS):
         epoch_start = time.time()
+        if train_sampler is not None:
+            train_sampler.set_epoch(epoch)
         
         # Train
-        train_loss, train_acc = train_epoch(model, train_loader, criterion, optimizer, device)
+        train_loss, train_acc = train_epoch(train_module, train_loader, criterion, optimizer, device, scaler)
         
         # Validate
-        val_loss, val_acc = validate(model, val_loader, criterion, device)
+        val_loss, val_acc = validate(train_module, val_loader, criterion, device)
         
         # Update learning rate
         scheduler.step()
@@ -297,44 +594,71 @@ def train_model():
         epoch_time = time.time() - epoch_start
         
         # Print progress
-        print(f"\nEpoch [{epoch+1}/{NUM_EPOCHS}] ({epoch_time:.1f}s)")
-        print(f"  Train Loss: {train_loss:.4f} | Train Acc: {train_acc:.4f}")
-        print(f"  Val Loss:   {val_loss:.4f} | Val Acc:   {val_acc:.4f}")
+        log(f"\nEpoch [{epoch+1}/{NUM_EPOCHS}] ({epoch_time:.1f}s)")
+        log(f"  Train Loss: {train_loss:.4f} | Train Acc: {train_acc:.4f}")
+        log(f"  Val Loss:   {val_loss:.4f} | Val Acc:   {val_acc:.4f}")
         
         # Save best model
-        if val_acc > best_val_acc:
+        if is_main and val_acc > best_val_acc:
             best_val_acc = val_acc
-            torch.save({
+            save_checkpoint({
                 'epoch': epoch,
                 'model_state_dict': model.state_dict(),
                 'optimizer_state_dict': optimizer.state_dict(),
                 'val_acc': val_acc,
                 'val_loss': val_loss,
                 'classes': train_dataset.classes,
-                'num_classes': num_classes,
-                'config': config
+                'num_classes': num_classes
             }, best_model_path)
-            print(f"  ✓ New best model saved! (Val Acc: {val_acc:.4f})")
+            log(f"  ✓ New best model saved! (Val Acc: {val_acc:.4f})")
     
     training_time = time.time() - start_time
     
-    print("\n" + "=" * 60)
-    print("Training completed!")
-    print("=" * 60)
-    print(f"Total training time: {training_time/60:.1f} minutes")
-    print(f"Best validation accuracy: {best_val_acc:.4f}")
-    print(f"Best model saved to: {best_model_path}")
+    log("\n" + "=" * 60)
+    log("Training completed!")
+    log("=" * 60)
+    log(f"Total training time: {training_time/60:.1f} minutes")
+    log(f"Best validation accuracy: {best_val_acc:.4f}")
+    log(f"Best model saved to: {best_model_path}")
+    
+    if distributed:
+        dist.destroy_process_group()
+    if not is_main:
+        return
+    
+    # Save the training config once instead of in every checkpoint
+    config_out_path = base_dir / 'models' / 'best_model_config.json'
+    save_json(config, config_out_path)
+    log(f"Training config saved to: {config_out_path}")
+    
+    # Plot and history share one timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Save training history plot
-    plot_path = base_dir / 'models' / f'training_history_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
+    plot_path = base_dir / 'models' / f'training_history_{timestamp}.png'
     save_training_plot(history, plot_path)
     
     # Save training history as JSON
-    history_path = base_dir / 'models' / f'training_history_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-    with open(history_path, 'w') as f:
-        json.dump(history, f, indent=2)
-    print(f"Training history saved to: {history_path}")
+    history_path = base_dir / 'models' / f'training_history_{timestamp}.json'
+    save_json(history, history_path)
+    log(f"Training history saved to: {history_path}")
 
 
 if __name__ == '__main__':
-    train_model()
+    parser = argparse.ArgumentParser(description='Train ResNet18 with transfer learning')
+    parser.add_argument('--cache-features', action='store_true',
+                        help='Compute frozen backbone features once and train only the classifier head')
+    parser.add_argument('--cache-views', type=int, default=1,
+                        help='Augmented views to cache per training image (default: 1, no augmentation)')
+    parser.add_argument('--compile', action='store_true',
+                        help='Compile the model with torch.compile (requires a working Triton/C++ toolchain)')
+    parser.add_argument('--precache', action='store_true',
+                        help='Decode and preprocess images once into <split>_tensors.pt next to each split')
+    args = parser.parse_args()
+    
+    train_model(
+        cache_features=args.cache_features,
+        cache_views=args.cache_views,
+        compile_model=args.compile,
+        precache=args.precache
+    )
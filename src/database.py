@@ -68,7 +68,7 @@ class Database:
     
     def hash_password(self, password):
         """
-        Hash password using SHA-256.
+        Hash password using salted PBKDF2-HMAC-SHA256.
         
         SRP: Delegates to password hasher service.
         """
@@ -4,13 +4,16 @@ Authentication interfaces following SOLID principles.
 These interfaces demonstrate:
 - Interface Segregation Principle: Separate interfaces for different auth concerns
 - Dependency Inversion Principle: UI depends on these abstractions
+
+They are structural typing.Protocol classes: implementations satisfy an
+interface by providing its methods and do not need to inherit from it.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Protocol, runtime_checkable
 
 
-class IAuthenticationService(ABC):
+@runtime_checkable
+class IAuthenticationService(Protocol):
     """
     Interface for authentication operations.
     
@@ -19,23 +22,21 @@ class IAuthenticationService(ABC):
     SRP: Only handles authentication, not session management or UI.
     """
     
-    @abstractmethod
     def login(self, username: str, password: str) -> bool:
         """Authenticate user with credentials."""
-        pass
+        ...
     
-    @abstractmethod
     def register(self, username: str, password: str, email: str = '') -> bool:
         """Register a new user."""
-        pass
+        ...
     
-    @abstractmethod
     def validate_credentials(self, username: str, password: str) -> bool:
         """Validate user credentials without logging in."""
-        pass
+        ...
 
 
-class ISessionManager(ABC):
+@runtime_checkable
+class ISessionManager(Protocol):
     """
     Interface for session management.
     
@@ -44,28 +45,25 @@ class ISessionManager(ABC):
     SRP: Only manages session state.
     """
     
-    @abstractmethod
     def is_logged_in(self) -> bool:
         """Check if user is logged in."""
-        pass
+        ...
     
-    @abstractmethod
     def get_username(self) -> Optional[str]:
         """Get current logged in username."""
-        pass
+        ...
     
-    @abstractmethod
     def create_session(self, username: str) -> None:
         """Create a new session for user."""
-        pass
+        ...
     
-    @abstractmethod
     def destroy_session(self) -> None:
         """Destroy current session."""
-        pass
+        ...
 
 
-class IPasswordValidator(ABC):
+@runtime_checkable
+class IPasswordValidator(Protocol):
     """
     Interface for password validation rules.
     
@@ -74,7 +72,6 @@ class IPasswordValidator(ABC):
     SRP: Only validates passwords.
     """
     
-    @abstractmethod
     def validate(self, password: str) -> tuple[bool, str]:
         """
         Validate password against rules.
@@ -82,4 +79,4 @@ class IPasswordValidator(ABC):
         Returns:
             tuple: (is_valid, error_message)
         """
-        pass
+        ...
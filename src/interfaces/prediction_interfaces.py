@@ -8,7 +8,7 @@ These interfaces demonstrate:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Sequence
 from PIL import Image
 
 
@@ -45,6 +45,16 @@ class IImagePreprocessor(ABC):
     def preprocess(self, image: Image.Image) -> Any:
         """Preprocess an image for model input."""
         pass
+    
+    def preprocess_batch(self, images: List[Any]) -> Any:
+        """
+        Preprocess several images into one stacked batch.
+        
+        The default stacks the output of preprocess(); implementations may
+        override it to control the batch allocation.
+        """
+        import torch
+        return torch.stack([self.preprocess(image) for image in images])
 
 
 class IPredictionService(ABC):
@@ -57,10 +67,14 @@ class IPredictionService(ABC):
     """
     
     @abstractmethod
-    def predict(self, image: Any) -> Dict[str, Any]:
+    def predict(self, image: Any, return_probabilities: bool = True) -> Dict[str, Any]:
         """
         Make prediction on a single image.
         
+        Args:
+            image: Image to classify
+            return_probabilities: Include the per-class probabilities
+        
         Returns:
             Dictionary with prediction results.
         """
@@ -82,13 +96,13 @@ class IDiseaseInfoProvider(ABC):
     """
     
     @abstractmethod
-    def get_disease_info(self, disease_name: str) -> Dict[str, str]:
+    def get_disease_info(self, disease_name: str) -> Mapping[str, str]:
         """Get information about a disease."""
         pass
     
     @abstractmethod
-    def get_all_diseases(self) -> List[str]:
-        """Get list of all supported diseases."""
+    def get_all_diseases(self) -> Sequence[str]:
+        """Get all supported diseases."""
         pass
 
 
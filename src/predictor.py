@@ -12,15 +12,19 @@ Maintains backward compatibility with existing code.
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 
+import torch
+
 from src.transforms import ImageTransformer
 from src.services.prediction_services import (
     PyTorchModelLoader,
     ImagePreprocessor,
     JSONClassNameProvider,
     StaticDiseaseInfoProvider,
-    PredictionService
+    PredictionService,
+    autocast_context
 )
 
 
@@ -50,16 +54,42 @@ class Predictor:
       can be substituted without breaking functionality.
     """
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        'base_dir', 'class_provider', 'model', 'device', 'preprocessor',
+        'prediction_service', 'disease_info_provider', 'classes', 'num_classes',
+        'model_path', 'config_path', 'transformer',
+        '_autocast_dtype', '_classes_tuple'
+    )
+    
     def __init__(
         self,
         model_path='models/best_model.pth',
-        config_path='config/class_names.json'
+        config_path='config/class_names.json',
+        precision='auto',
+        compile_model=False,
+        warmup=True,
+        cuda_graph=False,
+        freeze=False
     ):
         """
         Initialize predictor with dependency injection.
         
         DIP: Creates and injects dependencies based on interfaces.
         SRP: Each component has a single responsibility.
+        
+        Args:
+            model_path: Path to the model weights, relative to the project root
+            config_path: Path to the class names file, relative to the project root
+            precision: Inference precision ('auto', 'fp32', 'fp16', 'amp' or
+                'int8'), see PyTorchModelLoader. 'int8' calibrates on the
+                images in config/calibration when that directory exists
+            compile_model: Compile the model at load time, see PyTorchModelLoader
+            warmup: Warm the model up at load time, see PyTorchModelLoader
+            cuda_graph: Replay single-image inference from a captured CUDA
+                graph, see PyTorchModelLoader
+            freeze: Script and freeze the model with BatchNorm folded into
+                the convolutions, see PyTorchModelLoader
         """
         # Get the project root directory (parent of src)
         self.base_dir = Path(__file__).parent.parent
@@ -70,18 +100,49 @@ class Predictor:
         # OCP: Could easily switch to database or API-based provider
         self.class_provider = JSONClassNameProvider(config_full_path)
         
+        # Image transformer defines the model input size
+        transformer = ImageTransformer()
+        
+        # Sample images for calibrating int8 quantization, if provided;
+        # without any, int8 falls back to dynamic quantization
+        calibration_dir = self.base_dir / 'config' / 'calibration'
+        calibration_images = []
+        if calibration_dir.is_dir():
+            calibration_images = sorted(
+                path for path in calibration_dir.iterdir()
+                if path.suffix.lower() in ('.jpg', '.jpeg', '.png')
+            )
+        calibration_loader = None
+        if calibration_images:
+            calibration_loader = lambda: ImagePreprocessor(transformer).preprocess_batch(
+                calibration_images
+            )
+        
         # Create model loader (SRP: only loads models)
         # DIP: Depends on IModelLoader interface
-        model_loader = PyTorchModelLoader(self.class_provider.get_class_count())
+        model_loader = PyTorchModelLoader(
+            self.class_provider.get_class_count(),
+            precision=precision,
+            compile_model=compile_model,
+            freeze=freeze,
+            input_size=transformer.target_size,
+            cuda_graph=cuda_graph,
+            calibration_loader=calibration_loader,
+            warmup=warmup
+        )
         
         # Load model
         self.model = model_loader.load_model(model_full_path)
         self.device = model_loader.get_device()
+        autocast_dtype = model_loader.get_autocast_dtype()
         
         # Create image preprocessor (SRP: only preprocesses images)
         # DIP: Depends on ImageTransformer abstraction
-        transformer = ImageTransformer()
-        self.preprocessor = ImagePreprocessor(transformer)
+        self.preprocessor = ImagePreprocessor(
+            transformer,
+            dtype=model_loader.get_input_dtype(),
+            device=self.device if self.device.type == 'cuda' else None
+        )
         
         # Create prediction service (SRP: only makes predictions)
         # DIP: All dependencies injected through interfaces
@@ -89,7 +150,8 @@ class Predictor:
             model=self.model,
             preprocessor=self.preprocessor,
             class_provider=self.class_provider,
-            device=self.device
+            device=self.device,
+            autocast_dtype=autocast_dtype
         )
         
         # Create disease info provider (SRP: only provides disease info)
@@ -102,25 +164,62 @@ class Predictor:
         self.model_path = self.base_dir / model_path
         self.config_path = self.base_dir / config_path
         self.transformer = transformer
+        
+        # Precomputed state for the predict_image_fast hot path
+        self._autocast_dtype = autocast_dtype
+        self._classes_tuple = tuple(self.classes)
     
-    def predict_image(self, image):
+    def predict_image(self, image, return_probabilities=True):
         """
         Predict disease class for a single image.
         
         Args:
-            image: PIL Image, file path, or file-like object
+            image: PIL Image, file path, file-like object, or encoded image bytes
+            return_probabilities: Include all_probabilities in the result;
+                pass False when only the label and confidence are needed
             
         Returns:
             Dictionary with prediction results:
                 - predicted_class: Name of predicted class
                 - confidence: Confidence score (0-100)
                 - all_probabilities: Dictionary of all class probabilities
+                  (only if return_probabilities is True)
         
         SOLID:
         - SRP: Delegates to prediction service
         - DIP: Uses interface-based service
         """
-        return self.prediction_service.predict(image)
+        return self.prediction_service.predict(image, return_probabilities)
+    
+    def predict_image_fast(self, image):
+        """
+        Predict disease class for a single PIL image with minimal overhead.
+        
+        Bypasses the service layer and skips the per-class probability
+        breakdown, but shares the preprocessor, so on CUDA the image is
+        transformed on the GPU. Use predict_image for file paths, file-like
+        objects or when all class probabilities are needed.
+        
+        Args:
+            image: PIL Image
+            
+        Returns:
+            Dictionary with prediction results:
+                - predicted_class: Name of predicted class
+                - confidence: Confidence score (0-100)
+        """
+        x = self.preprocessor.preprocess(image).unsqueeze(0)
+        x = x.to(self.device, non_blocking=True).contiguous(memory_format=torch.channels_last)
+        
+        with torch.inference_mode(), autocast_context(self.device, self._autocast_dtype):
+            probs = self.model(x)[0].softmax(-1, dtype=torch.float32).cpu().tolist()
+        
+        # One host transfer, then pick the winner in Python
+        index = max(range(len(probs)), key=probs.__getitem__)
+        return {
+            'predicted_class': self._classes_tuple[index],
+            'confidence': probs[index] * 100
+        }
     
     def predict_batch(self, images):
         """
@@ -154,3 +253,27 @@ class Predictor:
         - OCP: Can be extended to use database or API without modifying this method
         """
         return self.disease_info_provider.get_disease_info(disease_name)
+
+
+@lru_cache(maxsize=4)
+def get_predictor(
+    model_path='models/best_model.pth',
+    config_path='config/class_names.json',
+    precision='auto'
+):
+    """
+    Get a shared Predictor for the given model and class names files.
+    
+    Predictors are cached per (model_path, config_path, precision), so the model
+    weights are read from disk and loaded onto the device only once per
+    process. A failed load is not cached and will be retried.
+    
+    Args:
+        model_path: Path to the model weights, relative to the project root
+        config_path: Path to the class names file, relative to the project root
+        precision: Inference precision, see Predictor
+        
+    Returns:
+        Predictor instance
+    """
+    return Predictor(model_path, config_path, precision)
@@ -5,25 +5,23 @@ Authentication service implementations following SOLID principles.
 import streamlit as st
 from typing import Optional
 
-from src.interfaces.auth_interfaces import (
-    IAuthenticationService,
-    ISessionManager,
-    IPasswordValidator
-)
 from src.interfaces.data_interfaces import IUserRepository, IPasswordHasher
 
 
-class PasswordValidator(IPasswordValidator):
+class PasswordValidator:
     """
     Password validation implementation.
     
     SOLID Principles Applied:
     - SRP: Only validates passwords
     - OCP: Can be extended with additional validators without modification
+    - DIP: Satisfies the IPasswordValidator protocol
     """
     
     def __init__(self, min_length: int = 4):
         self.min_length = min_length
+        # Formatted once rather than on every rejected password
+        self._too_short = f"Password must be at least {min_length} characters long"
     
     def validate(self, password: str) -> tuple[bool, str]:
         """
@@ -35,17 +33,17 @@ class PasswordValidator(IPasswordValidator):
         if not password:
             return False, "Password cannot be empty"
         if len(password) < self.min_length:
-            return False, f"Password must be at least {self.min_length} characters long"
+            return False, self._too_short
         return True, ""
 
 
-class StreamlitSessionManager(ISessionManager):
+class StreamlitSessionManager:
     """
     Session manager using Streamlit's session state.
     
     SOLID Principles Applied:
     - SRP: Only manages session state
-    - DIP: Implements ISessionManager interface
+    - DIP: Satisfies the ISessionManager protocol
     - LSP: Can be replaced with Redis or other session stores
     """
     
@@ -75,13 +73,14 @@ class StreamlitSessionManager(ISessionManager):
         st.session_state.username = None
 
 
-class AuthenticationService(IAuthenticationService):
+class AuthenticationService:
     """
     Authentication service implementation.
     
     SOLID Principles Applied:
     - SRP: Only handles authentication logic
-    - DIP: Depends on IUserRepository and IPasswordHasher abstractions
+    - DIP: Depends on IUserRepository and IPasswordHasher abstractions,
+      satisfies the IAuthenticationService protocol
     - OCP: Closed for modification, open for extension
     """
     
@@ -6,6 +6,10 @@ This module contains concrete implementations of data interfaces.
 
 import sqlite3
 import hashlib
+import hmac
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -18,7 +22,10 @@ from src.interfaces.data_interfaces import (
 
 class SHA256PasswordHasher(IPasswordHasher):
     """
-    SHA-256 password hasher implementation.
+    Salted PBKDF2-HMAC-SHA256 password hasher implementation.
+    
+    Hashes are stored as ``salt$iterations$hex_digest``. Plain SHA-256 hex
+    digests written by earlier versions are still accepted by verify_password.
     
     SOLID Principles Applied:
     - SRP: Only responsible for password hashing
@@ -26,19 +33,42 @@ class SHA256PasswordHasher(IPasswordHasher):
     - LSP: Can be substituted with any IPasswordHasher implementation
     """
     
+    def __init__(self, iterations: int = 200_000, salt_bytes: int = 16):
+        self.iterations = iterations
+        self.salt_bytes = salt_bytes
+    
     def hash_password(self, password: str) -> str:
-        """Hash password using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hash password using PBKDF2-HMAC-SHA256 with a random salt."""
+        salt = os.urandom(self.salt_bytes)
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, self.iterations)
+        return f"{salt.hex()}${self.iterations}${digest.hex()}"
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify password against hash."""
-        return self.hash_password(plain_password) == hashed_password
+        """Verify password against hash using a constant-time comparison."""
+        if '$' not in hashed_password:
+            # Legacy unsalted SHA-256 hash
+            legacy = hashlib.sha256(plain_password.encode()).hexdigest()
+            return hmac.compare_digest(legacy, hashed_password)
+        
+        try:
+            salt_hex, iterations, digest_hex = hashed_password.split('$')
+            salt = bytes.fromhex(salt_hex)
+            iterations = int(iterations)
+        except ValueError:
+            return False
+        
+        digest = hashlib.pbkdf2_hmac('sha256', plain_password.encode(), salt, iterations)
+        return hmac.compare_digest(digest.hex(), digest_hex)
 
 
 class SQLiteConnection(IDatabaseConnection):
     """
     SQLite database connection manager.
     
+    The connection runs in autocommit mode with WAL journaling so readers are
+    not blocked by a writer, and may be shared across threads. A single
+    cursor is reused for all statements, guarded by a lock.
+    
     SOLID Principles Applied:
     - SRP: Only manages database connections and queries
     - OCP: Can be extended without modification
@@ -48,6 +78,8 @@ class SQLiteConnection(IDatabaseConnection):
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.connection = None
+        self._cursor = None
+        self._lock = threading.Lock()
         # Ensure directory exists
         db_dir = Path(db_path).parent
         if not db_dir.exists():
@@ -56,30 +88,39 @@ class SQLiteConnection(IDatabaseConnection):
     def connect(self):
         """Establish connection to SQLite database."""
         if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
+            self.connection = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None
+            )
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+            self.connection.execute('PRAGMA temp_store=MEMORY')
+            self.connection.execute('PRAGMA cache_size=-20000')
+            self._cursor = self.connection.cursor()
         return self.connection
     
     def close(self):
         """Close database connection."""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        with self._lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+                self._cursor = None
     
     def execute_query(self, query: str, params: tuple = ()):
         """Execute a SELECT query and return results."""
-        conn = self.connect()
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        result = cursor.fetchall()
-        return result
+        with self._lock:
+            self.connect()
+            self._cursor.execute(query, params)
+            return self._cursor.fetchall()
     
     def execute_commit(self, query: str, params: tuple = ()) -> bool:
-        """Execute an INSERT/UPDATE/DELETE query and commit."""
+        """Execute an INSERT/UPDATE/DELETE query (autocommitted)."""
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
+            with self._lock:
+                self.connect()
+                self._cursor.execute(query, params)
             return True
         except sqlite3.IntegrityError:
             return False
@@ -106,6 +147,8 @@ class UserRepository(IUserRepository):
         """
         self.db = db_connection
         self.hasher = password_hasher
+        # Per-instance cache of user rows; misses raise and are never cached
+        self._cached_user_row = lru_cache(maxsize=1024)(self._fetch_user_row)
         self._init_table()
     
     def _init_table(self):
@@ -127,31 +170,44 @@ class UserRepository(IUserRepository):
         SRP: Only creates user, delegates hashing to IPasswordHasher.
         """
         hashed_password = self.hasher.hash_password(password)
-        return self.db.execute_commit(
+        created = self.db.execute_commit(
             'INSERT INTO users (username, password, email) VALUES (?, ?, ?)',
             (username, hashed_password, email)
         )
+        self._cached_user_row.cache_clear()
+        return created
     
-    def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
-        """Retrieve user by username."""
+    def _fetch_user_row(self, username: str) -> tuple:
+        """Fetch a user row, raising KeyError if the user does not exist."""
         result = self.db.execute_query(
             'SELECT id, username, password, email, created_at FROM users WHERE username = ?',
             (username,)
         )
-        if result:
-            row = result[0]
-            return {
-                'id': row[0],
-                'username': row[1],
-                'password': row[2],
-                'email': row[3],
-                'created_at': row[4]
-            }
-        return None
+        if not result:
+            raise KeyError(username)
+        return tuple(result[0])
+    
+    def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
+        """Retrieve user by username."""
+        try:
+            row = self._cached_user_row(username)
+        except KeyError:
+            return None
+        return {
+            'id': row[0],
+            'username': row[1],
+            'password': row[2],
+            'email': row[3],
+            'created_at': row[4]
+        }
     
     def user_exists(self, username: str) -> bool:
         """Check if username exists."""
-        return self.get_user_by_username(username) is not None
+        result = self.db.execute_query(
+            'SELECT 1 FROM users WHERE username = ? LIMIT 1',
+            (username,)
+        )
+        return bool(result)
     
     def get_user_count(self) -> int:
         """Get total number of users."""
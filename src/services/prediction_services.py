@@ -2,12 +2,21 @@
 Prediction service implementations following SOLID principles.
 """
 
+import io
 import json
+import math
+import os
+import threading
 import torch
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image
-from typing import Any, Dict, List
-import torchvision.models as models
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from torchvision.io import ImageReadMode, decode_jpeg
+from torchvision.transforms.v2.functional import pil_to_tensor
 
 from src.interfaces.prediction_interfaces import (
     IModelLoader,
@@ -17,6 +26,79 @@ from src.interfaces.prediction_interfaces import (
     IClassNameProvider
 )
 
+# PyTurboJPEG is optional; fall back to PIL for JPEG decoding
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _TURBO_JPEG = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # Not installed, or the libturbojpeg shared library is missing
+    _TURBO_JPEG = None
+
+_JPEG_MAGIC = b'\xff\xd8\xff'
+
+# orjson is optional; fall back to the standard library parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _has_torch_tensorrt() -> bool:
+    """Check whether torch_tensorrt is installed (importing it registers the backend)."""
+    try:
+        import torch_tensorrt  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def autocast_context(device: torch.device, dtype: Optional[torch.dtype]):
+    """Return an autocast context for dtype on device, or a no-op if dtype is None."""
+    if dtype is None:
+        return nullcontext()
+    return torch.autocast(device_type=device.type, dtype=dtype)
+
+
+class CUDAGraphModel(torch.nn.Module):
+    """
+    Replays a captured CUDA graph for fixed-shape single-image inference.
+    
+    Inputs with the captured shape are copied into a static buffer and the
+    recorded kernels are replayed, skipping per-layer launch overhead. Any
+    other shape (e.g. batches) runs the wrapped model eagerly.
+    """
+    
+    def __init__(self, model: torch.nn.Module, example: torch.Tensor, autocast_dtype=None):
+        super().__init__()
+        self.model = model
+        self.static_input = example.clone()
+        self._lock = threading.Lock()
+        
+        with torch.inference_mode(), autocast_context(example.device, autocast_dtype):
+            # Warm up on a side stream before capture, as CUDA graphs require
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    model(self.static_input)
+            torch.cuda.current_stream().wait_stream(stream)
+            
+            self.graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(self.graph):
+                self.static_output = model(self.static_input)
+    
+    def replay(self, x: torch.Tensor) -> torch.Tensor:
+        """Run the captured graph on x, which must match the captured shape."""
+        with self._lock:
+            self.static_input.copy_(x)
+            self.graph.replay()
+            return self.static_output.clone()
+    
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if x.shape == self.static_input.shape:
+            return self.replay(x)
+        return self.model(x)
+
 
 class PyTorchModelLoader(IModelLoader):
     """
@@ -28,37 +110,264 @@ class PyTorchModelLoader(IModelLoader):
     - DIP: Implements IModelLoader interface
     """
     
-    def __init__(self, num_classes: int):
+    PRECISIONS = ('auto', 'fp32', 'fp16', 'amp', 'int8')
+    
+    # Forward passes run by the load-time warm-up
+    WARMUP_ITERATIONS = 3
+    
+    def __init__(
+        self,
+        num_classes: int,
+        precision: str = 'auto',
+        compile_model: bool = False,
+        freeze: bool = False,
+        input_size: Tuple[int, int] = (224, 224),
+        cuda_graph: bool = False,
+        calibration_loader: Optional[Callable[[], torch.Tensor]] = None,
+        warmup: bool = True
+    ):
+        """
+        Initialize the loader.
+        
+        Args:
+            num_classes: Number of output classes
+            precision: Inference precision. 'fp16' runs the model in half
+                precision on CUDA, 'amp' keeps fp32 weights but runs the
+                forward pass under fp16 autocast on CUDA, 'int8' quantizes
+                the model to int8 on CPU (see calibration_loader) and
+                'fp32' keeps full precision. 'auto' uses fp16 on CUDA and
+                fp32 on CPU. Precisions the device cannot run fall back to
+                fp32.
+            compile_model: Compile the loaded model and warm it up, so
+                compilation happens at load time rather than on the first
+                prediction. Uses the TensorRT backend when torch_tensorrt
+                is installed and running on CUDA, torch.compile's default
+                backend otherwise, and falls back to torch.jit.trace if
+                compilation fails.
+            freeze: Script the model with TorchScript, freeze it and run
+                torch.jit.optimize_for_inference, which folds BatchNorm into
+                the preceding convolutions and inlines the weights as
+                constants. Ignored with compile_model and for 'int8'.
+            input_size: (height, width) of model inputs, used for warm-up
+            cuda_graph: On CUDA, capture single-image inference into a CUDA
+                graph (see CUDAGraphModel). Ignored on CPU and when
+                compile_model is set, since torch.compile's reduce-overhead
+                mode already uses CUDA graphs.
+            calibration_loader: For 'int8', returns a batch of preprocessed
+                images used to calibrate static post-training quantization
+                of the whole network. The quantized weights are cached next
+                to the checkpoint as '<name>_quantized.pth' and reused while
+                newer than the checkpoint (delete the file to recalibrate),
+                so this is only called when no cache is available. Without
+                it, only the Linear layers are quantized dynamically.
+            warmup: Run a few forward passes on a dummy input at load time,
+                so CUDA context creation, cuDNN autotuning and allocator
+                warm-up are not paid by the first real prediction
+        """
+        if precision not in self.PRECISIONS:
+            raise ValueError(
+                f"Unknown precision '{precision}', expected one of {self.PRECISIONS}"
+            )
+        
         self.num_classes = num_classes
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        self.precision = self._resolve_precision(precision)
+        self.compile_model = compile_model
+        self.freeze = freeze and not compile_model and self.precision != 'int8'
+        self.input_size = tuple(input_size)
+        self.cuda_graph = cuda_graph and self.device.type == 'cuda' and not compile_model
+        self.calibration_loader = calibration_loader
+        self.warmup = warmup
+        
+        if self.device.type == 'cuda':
+            # Inputs have a fixed shape, so let cuDNN pick the fastest kernels
+            torch.backends.cudnn.benchmark = True
+            # Allow TF32 tensor-core math for fp32 convolutions and matmuls
+            torch.backends.cudnn.allow_tf32 = True
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.set_float32_matmul_precision('high')
     
     def load_model(self, model_path: str) -> Any:
         """Load ResNet18 model from checkpoint."""
-        # Create model architecture
-        model = models.resnet18(weights=None)
-        
-        # Modify final layer (same structure as training)
-        num_ftrs = model.fc.in_features
-        model.fc = torch.nn.Sequential(
-            torch.nn.Dropout(0.5),
-            torch.nn.Linear(num_ftrs, self.num_classes)
-        )
+        if self.precision == 'int8' and self.calibration_loader is not None:
+            model = self._load_static_int8(model_path)
+        else:
+            model = self._load_fp32(model_path)
+        
+        # Reduce precision for faster inference
+        if self.precision == 'fp16':
+            model.half()
+        elif self.precision == 'int8' and self.calibration_loader is None:
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        
+        if self.compile_model:
+            model = self._compile(model)
+        elif self.freeze:
+            model = self._freeze(model)
+        
+        if self.cuda_graph:
+            model = CUDAGraphModel(model, self._example_input(), self.get_autocast_dtype())
+        
+        if self.warmup:
+            self._warmup(model)
+        
+        return model
+    
+    def _build_model(self, device: Any = 'meta') -> torch.nn.Module:
+        """
+        Create the ResNet18 architecture with the training classifier head.
+        
+        By default the modules are created on the meta device: parameters
+        have shapes but no storage, so no memory is allocated or initialised
+        for weights that load_state_dict(assign=True) replaces anyway.
+        """
+        import torchvision.models as models
+        
+        with torch.device(device):
+            model = models.resnet18(weights=None)
+            
+            # Modify final layer (same structure as training)
+            num_ftrs = model.fc.in_features
+            model.fc = torch.nn.Sequential(
+                torch.nn.Dropout(0.5),
+                torch.nn.Linear(num_ftrs, self.num_classes)
+            )
+        return model
+    
+    def _load_fp32(self, model_path: str) -> torch.nn.Module:
+        """Load the checkpoint weights into a full-precision model."""
+        model = self._build_model()
         
-        # Load weights
-        checkpoint = torch.load(model_path, map_location=self.device)
+        # For GPU models, memory-map the checkpoint: weights are paged in
+        # as they are copied to the device and the mapping is then dropped.
+        # CPU models would keep serving from the mapped file, which breaks
+        # (SIGBUS, or silently changed weights) if it is rewritten in place.
+        checkpoint = torch.load(
+            model_path,
+            map_location='cpu',
+            mmap=self.device.type != 'cpu',
+            weights_only=True
+        )
         if isinstance(checkpoint, dict) and 'model_state_dict' in checkpoint:
-            model.load_state_dict(checkpoint['model_state_dict'])
-        else:
-            model.load_state_dict(checkpoint)
+            checkpoint = checkpoint['model_state_dict']
+        model.load_state_dict(checkpoint, assign=True)
         
         model.to(self.device)
+        # NHWC lets cuDNN/oneDNN pick their faster (tensor-core) conv kernels
+        model.to(memory_format=torch.channels_last)
         model.eval()
+        return model
+    
+    def _load_static_int8(self, model_path: str) -> torch.nn.Module:
+        """
+        Load a statically quantized int8 model, calibrating it if needed.
+        
+        Quantizes convolutions as well as the classifier, which is where
+        ResNet18 spends its time. Calibration needs a full-precision pass
+        over the calibration images, so the result is cached on disk.
+        """
+        from torch.ao.quantization import get_default_qconfig_mapping
+        from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
         
+        checkpoint_path = Path(model_path)
+        cache_path = checkpoint_path.with_name(f"{checkpoint_path.stem}_quantized.pth")
+        qconfig_mapping = get_default_qconfig_mapping(torch.backends.quantized.engine)
+        example = (self._example_input(),)
+        
+        if cache_path.exists() and cache_path.stat().st_mtime >= checkpoint_path.stat().st_mtime:
+            # Converting an uncalibrated model gives the quantized module layout
+            # Quantized modules need real tensors to pack, so skip the meta device
+            prepared = prepare_fx(self._build_model('cpu').eval(), qconfig_mapping, example)
+            model = convert_fx(prepared)
+            model.load_state_dict(
+                torch.load(cache_path, map_location=self.device, weights_only=True)
+            )
+            return model
+        
+        prepared = prepare_fx(self._load_fp32(model_path), qconfig_mapping, example)
+        with torch.no_grad():
+            prepared(self.calibration_loader().to(self.device))
+        model = convert_fx(prepared)
+        
+        try:
+            # Write atomically so a concurrent load never sees a partial file
+            tmp_path = cache_path.with_suffix(f'.tmp{os.getpid()}')
+            torch.save(model.state_dict(), tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Read-only deployments just recalibrate on the next start
+            pass
         return model
     
     def get_device(self) -> Any:
         """Get computation device."""
         return self.device
+    
+    def get_input_dtype(self) -> torch.dtype:
+        """Get the dtype the loaded model expects its inputs in."""
+        return torch.float16 if self.precision == 'fp16' else torch.float32
+    
+    def get_autocast_dtype(self) -> Optional[torch.dtype]:
+        """Get the dtype to autocast the forward pass to, if any."""
+        return torch.float16 if self.precision == 'amp' else None
+    
+    def _compile(self, model: torch.nn.Module) -> torch.nn.Module:
+        """
+        Compile a model and warm it up on an example input.
+        
+        torch.compile compiles lazily, so the warm-up pass is what triggers
+        (and validates) compilation. If it fails, e.g. because no compiler
+        toolchain is available, the model is traced with TorchScript instead.
+        """
+        example = self._example_input()
+        
+        try:
+            if self.device.type == 'cuda' and _has_torch_tensorrt():
+                compiled = torch.compile(model, backend='tensorrt', dynamic=False)
+            else:
+                compiled = torch.compile(model, mode='reduce-overhead', fullgraph=True)
+            with torch.inference_mode(), autocast_context(self.device, self.get_autocast_dtype()):
+                compiled(example)
+            return compiled
+        except Exception:
+            with torch.no_grad():
+                traced = torch.jit.trace(model, example)
+                traced(example)
+            return traced
+    
+    def _warmup(self, model: torch.nn.Module) -> None:
+        """Run dummy forward passes so one-time start-up costs happen now."""
+        example = self._example_input()
+        with torch.inference_mode(), autocast_context(self.device, self.get_autocast_dtype()):
+            for _ in range(self.WARMUP_ITERATIONS):
+                model(example)
+        if self.device.type == 'cuda':
+            torch.cuda.synchronize()
+    
+    def _freeze(self, model: torch.nn.Module) -> torch.jit.ScriptModule:
+        """Script, freeze and optimize a model for inference."""
+        frozen = torch.jit.freeze(torch.jit.script(model))
+        return torch.jit.optimize_for_inference(frozen)
+    
+    def _example_input(self) -> torch.Tensor:
+        """Create a dummy input matching a single preprocessed image."""
+        return torch.zeros(
+            1, 3, *self.input_size,
+            dtype=self.get_input_dtype(),
+            device=self.device
+        ).contiguous(memory_format=torch.channels_last)
+    
+    def _resolve_precision(self, precision: str) -> str:
+        """Map the requested precision to one the device supports."""
+        if precision == 'auto':
+            return 'fp16' if self.device.type == 'cuda' else 'fp32'
+        if precision in ('fp16', 'amp') and self.device.type != 'cuda':
+            return 'fp32'
+        if precision == 'int8' and self.device.type != 'cpu':
+            return 'fp32'
+        return precision
 
 
 class ImagePreprocessor(IImagePreprocessor):
@@ -71,23 +380,144 @@ class ImagePreprocessor(IImagePreprocessor):
     - LSP: Can be replaced with different preprocessing strategies
     """
     
-    def __init__(self, transformer):
+    def __init__(
+        self,
+        transformer,
+        dtype: torch.dtype = torch.float32,
+        pin_memory: bool = False,
+        num_workers: int = 4,
+        device: Optional[Any] = None
+    ):
         """
         Initialize with image transformer.
         
         DIP: Depends on transformer abstraction.
+        
+        Args:
+            transformer: Image transformer producing normalized tensors
+            dtype: Dtype of the returned tensors, matching the model
+            pin_memory: Return tensors in page-locked memory so they can be
+                copied to a CUDA device asynchronously
+            num_workers: Threads used to decode and transform batches
+                (1 disables threading)
+            device: If given, decode JPEGs with torchvision.io.decode_jpeg
+                and run resize/normalize as tensor ops on this device (e.g.
+                the GPU), returning tensors already on it. Otherwise images
+                are transformed on the CPU via PIL.
         """
         self.transformer = transformer
+        self.dtype = dtype
+        self.device = torch.device(device) if device is not None else None
+        # Page-locked staging only matters for CPU tensors bound for a GPU
+        self.pin_memory = pin_memory and self.device is None
+        self.num_workers = num_workers
+        self._executor = None
     
     def preprocess(self, image: Image.Image) -> Any:
         """Preprocess image to tensor."""
+        tensor = self._transform(image)
+        if self.pin_memory:
+            tensor = tensor.pin_memory()
+        return tensor
+    
+    def preprocess_batch(self, images: List[Any]) -> Any:
+        """
+        Preprocess images straight into one (optionally pinned) batch tensor.
+        
+        Raises:
+            ValueError: If images is empty, since the batch shape is unknown
+        """
+        if not images:
+            raise ValueError("preprocess_batch needs at least one image")
+        
+        # PIL decoding and resizing release the GIL, so threads overlap
+        if self.num_workers > 1 and len(images) > 1:
+            tensors = list(self._get_executor().map(self._transform, images))
+        else:
+            tensors = [self._transform(image) for image in images]
+        
+        if self.device is not None:
+            return torch.stack(tensors)
+        
+        batch = torch.empty(
+            (len(tensors), *tensors[0].shape),
+            dtype=self.dtype,
+            pin_memory=self.pin_memory
+        )
+        return torch.stack(tensors, out=batch)
+    
+    def _transform(self, image: Any) -> torch.Tensor:
+        """Load the image if needed and apply the inference transforms."""
+        if self.device is not None:
+            return self._transform_on_device(image)
+        
         if not isinstance(image, Image.Image):
-            if isinstance(image, (str, Path)):
+            if isinstance(image, (bytes, bytearray)):
+                image = self._decode_bytes(image)
+            elif isinstance(image, (str, Path)):
                 image = Image.open(image).convert('RGB')
             elif hasattr(image, 'read'):
                 image = Image.open(image).convert('RGB')
         
-        return self.transformer.transform(image)
+        return self.transformer.transform(image).to(self.dtype)
+    
+    def _transform_on_device(self, image: Any) -> torch.Tensor:
+        """Decode to a uint8 tensor on self.device and transform it there."""
+        if isinstance(image, (bytes, bytearray)):
+            data = image
+        elif isinstance(image, (str, Path)):
+            data = Path(image).read_bytes()
+        elif hasattr(image, 'read'):
+            data = image.read()
+        else:
+            data = None
+        
+        if data is not None and data[:3] == _JPEG_MAGIC:
+            encoded = torch.frombuffer(bytearray(data), dtype=torch.uint8)
+            tensor = decode_jpeg(encoded, mode=ImageReadMode.RGB, device=self.device)
+        elif data is not None or isinstance(image, Image.Image):
+            if data is not None:
+                image = Image.open(io.BytesIO(data))
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            tensor = pil_to_tensor(image)
+            if self.device.type == 'cuda':
+                # non_blocking only overlaps the upload from page-locked memory
+                tensor = tensor.pin_memory()
+            tensor = tensor.to(self.device, non_blocking=True)
+        else:
+            # Other inputs (e.g. NumPy arrays) go through the CPU pipeline
+            return self.transformer.transform(image).to(self.device, self.dtype)
+        
+        return self.transformer.get_inference_transforms()(tensor).to(self.dtype)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the preprocessing thread pool on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.num_workers,
+                thread_name_prefix='preprocess'
+            )
+        return self._executor
+    
+    @staticmethod
+    def _decode_bytes(data: bytes) -> Image.Image:
+        """Decode encoded image bytes, using libjpeg-turbo for JPEGs when available."""
+        if _TURBO_JPEG is not None and data[:3] == _JPEG_MAGIC:
+            return Image.fromarray(_TURBO_JPEG.decode(bytes(data), pixel_format=TJPF_RGB))
+        return Image.open(io.BytesIO(data)).convert('RGB')
+
+
+@lru_cache(maxsize=8)
+def _load_class_names_cached(path: str) -> Tuple[str, ...]:
+    """
+    Load class names from a JSON file, memoized per absolute path.
+    
+    Returns an immutable tuple so callers cannot modify the shared cache.
+    """
+    data = Path(path).read_bytes()
+    parsed = orjson.loads(data) if orjson is not None else json.loads(data)
+    return tuple(parsed['classes'])
 
 
 class JSONClassNameProvider(IClassNameProvider):
@@ -106,9 +536,7 @@ class JSONClassNameProvider(IClassNameProvider):
     
     def _load_classes(self):
         """Load class names from JSON file."""
-        with open(self.config_path, 'r') as f:
-            class_data = json.load(f)
-            self.classes = class_data['classes']
+        self.classes = list(_load_class_names_cached(str(self.config_path.resolve())))
     
     def get_class_names(self) -> List[str]:
         """Get list of class names."""
@@ -119,6 +547,33 @@ class JSONClassNameProvider(IClassNameProvider):
         return len(self.classes)
 
 
+_DISEASE_DATA = MappingProxyType({
+    'Bacterialblight': MappingProxyType({
+        'description': 'Bacterial blight is a serious disease affecting rice crops.',
+        'symptoms': 'Water-soaked lesions on leaves, wilting, and yellowing.',
+        'treatment': 'Use resistant varieties, proper water management, and copper-based bactericides.'
+    }),
+    'Blast': MappingProxyType({
+        'description': 'Rice blast is caused by a fungal pathogen and is one of the most destructive rice diseases.',
+        'symptoms': 'Diamond-shaped lesions with gray centers and brown margins on leaves.',
+        'treatment': 'Use resistant varieties, fungicide application, and proper field sanitation.'
+    }),
+    'Brownspot': MappingProxyType({
+        'description': 'Brown spot is a fungal disease that affects rice plants.',
+        'symptoms': 'Circular or oval brown spots on leaves, stems, and grains.',
+        'treatment': 'Seed treatment, balanced fertilization, and fungicide application.'
+    })
+})
+
+_ALL_DISEASES = tuple(_DISEASE_DATA)
+
+_UNKNOWN_DISEASE = MappingProxyType({
+    'description': 'Disease information not available.',
+    'symptoms': 'N/A',
+    'treatment': 'Please consult an agricultural expert.'
+})
+
+
 class StaticDiseaseInfoProvider(IDiseaseInfoProvider):
     """
     Static disease information provider.
@@ -130,35 +585,16 @@ class StaticDiseaseInfoProvider(IDiseaseInfoProvider):
     """
     
     def __init__(self):
-        self.disease_data = {
-            'Bacterialblight': {
-                'description': 'Bacterial blight is a serious disease affecting rice crops.',
-                'symptoms': 'Water-soaked lesions on leaves, wilting, and yellowing.',
-                'treatment': 'Use resistant varieties, proper water management, and copper-based bactericides.'
-            },
-            'Blast': {
-                'description': 'Rice blast is caused by a fungal pathogen and is one of the most destructive rice diseases.',
-                'symptoms': 'Diamond-shaped lesions with gray centers and brown margins on leaves.',
-                'treatment': 'Use resistant varieties, fungicide application, and proper field sanitation.'
-            },
-            'Brownspot': {
-                'description': 'Brown spot is a fungal disease that affects rice plants.',
-                'symptoms': 'Circular or oval brown spots on leaves, stems, and grains.',
-                'treatment': 'Seed treatment, balanced fertilization, and fungicide application.'
-            }
-        }
+        # Shared, read-only data: no per-instance copy
+        self.disease_data = _DISEASE_DATA
     
-    def get_disease_info(self, disease_name: str) -> Dict[str, str]:
+    def get_disease_info(self, disease_name: str) -> Mapping[str, str]:
         """Get information about a disease."""
-        return self.disease_data.get(disease_name, {
-            'description': 'Disease information not available.',
-            'symptoms': 'N/A',
-            'treatment': 'Please consult an agricultural expert.'
-        })
+        return self.disease_data.get(disease_name, _UNKNOWN_DISEASE)
     
-    def get_all_diseases(self) -> List[str]:
-        """Get list of all supported diseases."""
-        return list(self.disease_data.keys())
+    def get_all_diseases(self) -> Sequence[str]:
+        """Get all supported diseases."""
+        return _ALL_DISEASES
 
 
 class PredictionService(IPredictionService):
@@ -176,53 +612,110 @@ class PredictionService(IPredictionService):
         model: Any,
         preprocessor: IImagePreprocessor,
         class_provider: IClassNameProvider,
-        device: Any
+        device: Any,
+        autocast_dtype: Optional[torch.dtype] = None
     ):
         """
         Initialize with injected dependencies.
         
         DIP: All dependencies are abstractions.
+        
+        Args:
+            autocast_dtype: Run the forward pass under autocast to this
+                dtype (e.g. torch.float16), or None for no autocast
         """
         self.model = model
         self.preprocessor = preprocessor
         self.class_provider = class_provider
         self.device = device
+        self.autocast_dtype = autocast_dtype
+        
+        # Class names are fixed for the lifetime of the loaded model
+        self._classes = tuple(class_provider.get_class_names())
+        self._num_classes = len(self._classes)
     
-    def predict(self, image: Any) -> Dict[str, Any]:
+    def predict(self, image: Any, return_probabilities: bool = True) -> Dict[str, Any]:
         """
         Make prediction on a single image.
         
         SRP: Only makes predictions, delegates preprocessing and class resolution.
+        
+        Args:
+            image: Image to classify
+            return_probabilities: Include the per-class 'all_probabilities'
+                breakdown. When False the full softmax is skipped: the
+                predicted class is the argmax of the logits and only its
+                confidence is computed.
         """
         # Preprocess image
-        image_tensor = self.preprocessor.preprocess(image).unsqueeze(0).to(self.device)
+        image_tensor = self.preprocessor.preprocess(image).unsqueeze(0)
+        image_tensor = image_tensor.to(self.device, non_blocking=True)
+        image_tensor = image_tensor.contiguous(memory_format=torch.channels_last)
         
         # Make prediction
-        with torch.no_grad():
+        with torch.inference_mode(), autocast_context(self.device, self.autocast_dtype):
             outputs = self.model(image_tensor)
-            probabilities = torch.nn.functional.softmax(outputs, dim=1)
-            confidence, predicted = torch.max(probabilities, 1)
         
-        # Get results
-        classes = self.class_provider.get_class_names()
-        predicted_class = classes[predicted.item()]
-        confidence_pct = confidence.item() * 100
+        classes = self._classes
+        
+        if not return_probabilities:
+            # Copy the logits to the host in one transfer; softmax of the
+            # top logit alone gives the confidence
+            logits = outputs[0].cpu().tolist()
+            predicted = max(range(self._num_classes), key=logits.__getitem__)
+            top = logits[predicted]
+            return {
+                'predicted_class': classes[predicted],
+                'confidence': 100 / sum(math.exp(logit - top) for logit in logits)
+            }
         
-        # Get all class probabilities
-        all_probs = {}
-        for i, class_name in enumerate(classes):
-            all_probs[class_name] = probabilities[0][i].item() * 100
+        # Softmax upcasts fp16 logits itself, so no separate fp32 copy is
+        # made; copy all probabilities to the host in one transfer
+        probs = torch.softmax(outputs, dim=1, dtype=torch.float32)[0].cpu().tolist()
+        predicted = max(range(self._num_classes), key=probs.__getitem__)
         
         return {
-            'predicted_class': predicted_class,
-            'confidence': confidence_pct,
-            'all_probabilities': all_probs
+            'predicted_class': classes[predicted],
+            'confidence': probs[predicted] * 100,
+            'all_probabilities': {
+                class_name: prob * 100 for class_name, prob in zip(classes, probs)
+            }
         }
     
     def predict_batch(self, images: List[Any]) -> List[Dict[str, Any]]:
         """
         Make predictions on multiple images.
         
-        SRP: Delegates to single prediction method.
+        All images are preprocessed, stacked into a single batch and run
+        through the model in one forward pass.
         """
-        return [self.predict(image) for image in images]
+        if not images:
+            return []
+        
+        # Preprocess and stack into one (N, C, H, W) batch
+        batch = self.preprocessor.preprocess_batch(images)
+        batch = batch.to(self.device, non_blocking=True)
+        batch = batch.contiguous(memory_format=torch.channels_last)
+        
+        # Make predictions, moving the probabilities to the host in one transfer
+        with torch.inference_mode(), autocast_context(self.device, self.autocast_dtype):
+            outputs = self.model(batch)
+            probabilities = torch.softmax(outputs, dim=1, dtype=torch.float32).cpu()
+            confidences, predicted = torch.max(probabilities, 1)
+        
+        classes = self._classes
+        probabilities = probabilities.tolist()
+        confidences = confidences.tolist()
+        predicted = predicted.tolist()
+        
+        results = []
+        for probs, confidence, index in zip(probabilities, confidences, predicted):
+            results.append({
+                'predicted_class': classes[index],
+                'confidence': confidence * 100,
+                'all_probabilities': {
+                    class_name: prob * 100 for class_name, prob in zip(classes, probs)
+                }
+            })
+        
+        return results
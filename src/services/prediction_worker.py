@@ -0,0 +1,242 @@
+"""
+Out-of-process prediction following SOLID principles.
+
+A PredictionWorker hosts a single Predictor in a long-lived background
+process, so the model is loaded once and stays resident however often the
+Streamlit script reruns or how many sessions are open. Clients talk to it
+through RemotePredictionService, which implements IPredictionService and
+can be used anywhere a local PredictionService is.
+"""
+
+import multiprocessing
+import os
+import threading
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from src.interfaces.prediction_interfaces import IPredictionService
+
+
+def _serve(
+    address: Tuple[str, int],
+    authkey: bytes,
+    model_path: str,
+    config_path: str,
+    predictor_kwargs: Dict[str, Any],
+    ready: Connection
+) -> None:
+    """Load the predictor, report the bound address and serve clients forever."""
+    # Imported here so only the worker process loads torch and the model
+    from src.predictor import Predictor
+    
+    try:
+        predictor = Predictor(model_path, config_path, **predictor_kwargs)
+        listener = Listener(address, authkey=authkey)
+    except Exception as e:
+        ready.send(('error', f"{type(e).__name__}: {e}"))
+        return
+    
+    ready.send(('ok', listener.address))
+    ready.close()
+    
+    while True:
+        try:
+            conn = listener.accept()
+        except (OSError, multiprocessing.AuthenticationError):
+            continue
+        threading.Thread(target=_handle, args=(predictor, conn), daemon=True).start()
+
+
+def _handle(predictor: Any, conn: Connection) -> None:
+    """Answer requests from one client connection until it closes."""
+    with conn:
+        while True:
+            try:
+                method, payload, return_probabilities = conn.recv()
+            except (EOFError, OSError):
+                return
+            
+            try:
+                if method == 'predict':
+                    result = predictor.predict_image(payload, return_probabilities)
+                elif method == 'predict_batch':
+                    result = predictor.predict_batch(payload)
+                else:
+                    raise ValueError(f"Unknown method '{method}'")
+                reply = ('ok', result)
+            except Exception as e:
+                reply = ('error', f"{type(e).__name__}: {e}")
+            
+            try:
+                conn.send(reply)
+            except OSError:
+                # Client went away mid-request
+                return
+
+
+class PredictionWorker:
+    """
+    Background process that owns the model and serves predictions.
+    
+    SOLID Principles Applied:
+    - SRP: Only manages the lifetime of the prediction process
+    - OCP: Any Predictor configuration can be hosted via predictor_kwargs
+    - DIP: Clients depend on IPredictionService, not on this process
+    """
+    
+    def __init__(
+        self,
+        model_path: str = 'models/best_model.pth',
+        config_path: str = 'config/class_names.json',
+        address: Tuple[str, int] = ('127.0.0.1', 0),
+        authkey: Optional[bytes] = None,
+        **predictor_kwargs: Any
+    ):
+        """
+        Configure the worker; the process is started by start().
+        
+        Args:
+            model_path: Path to the model weights, see Predictor
+            config_path: Path to the class names file, see Predictor
+            address: (host, port) to listen on; port 0 picks a free port
+            authkey: Shared secret clients must present (random by default)
+            **predictor_kwargs: Passed through to Predictor (precision, ...)
+        """
+        self.model_path = model_path
+        self.config_path = config_path
+        self.address = address
+        self.authkey = authkey if authkey is not None else os.urandom(32)
+        self.predictor_kwargs = predictor_kwargs
+        self._process = None
+    
+    def start(self, timeout: Optional[float] = None) -> Tuple[str, int]:
+        """
+        Start the worker process and wait until the model is loaded.
+        
+        Returns:
+            The (host, port) address the worker is listening on
+        
+        Raises:
+            RuntimeError: If the model fails to load or the worker does not
+                report back within timeout seconds
+        """
+        if self.is_alive():
+            return self.address
+        
+        # spawn: a forked child cannot safely initialise CUDA
+        context = multiprocessing.get_context('spawn')
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=_serve,
+            args=(
+                self.address, self.authkey, self.model_path, self.config_path,
+                self.predictor_kwargs, child_conn
+            ),
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        
+        if not parent_conn.poll(timeout):
+            self.stop()
+            raise RuntimeError("Prediction worker did not start in time")
+        
+        try:
+            status, value = parent_conn.recv()
+        except EOFError:
+            status, value = 'error', "worker exited during start-up"
+        if status != 'ok':
+            self.stop()
+            raise RuntimeError(f"Prediction worker failed to start: {value}")
+        
+        self.address = value
+        return self.address
+    
+    def stop(self) -> None:
+        """Terminate the worker process."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+    
+    def is_alive(self) -> bool:
+        """Check whether the worker process is running."""
+        return self._process is not None and self._process.is_alive()
+    
+    def connect(self) -> 'RemotePredictionService':
+        """Create a client for this worker."""
+        return RemotePredictionService(self.address, self.authkey)
+
+
+class RemotePredictionService(IPredictionService):
+    """
+    Prediction service that forwards requests to a PredictionWorker.
+    
+    SOLID Principles Applied:
+    - SRP: Only serializes requests and relays results
+    - LSP: Drop-in replacement for PredictionService
+    - DIP: Implements IPredictionService interface
+    """
+    
+    def __init__(self, address: Tuple[str, int], authkey: bytes):
+        self.address = tuple(address)
+        self.authkey = authkey
+        self._conn = None
+        self._lock = threading.Lock()
+    
+    def predict(self, image: Any, return_probabilities: bool = True) -> Dict[str, Any]:
+        """Make prediction on a single image in the worker process."""
+        return self._call('predict', self._encode(image), return_probabilities)
+    
+    def predict_batch(self, images: List[Any]) -> List[Dict[str, Any]]:
+        """Make predictions on multiple images in the worker process."""
+        if not images:
+            return []
+        return self._call('predict_batch', [self._encode(image) for image in images], True)
+    
+    def close(self) -> None:
+        """Close the connection to the worker."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _call(self, method: str, payload: Any, return_probabilities: bool) -> Any:
+        """Send one request and wait for its result."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = Client(self.address, authkey=self.authkey)
+            try:
+                self._conn.send((method, payload, return_probabilities))
+                status, value = self._conn.recv()
+            except (EOFError, OSError):
+                # Reconnect on the next call, e.g. after a worker restart
+                self._conn.close()
+                self._conn = None
+                raise
+        
+        if status != 'ok':
+            raise RuntimeError(f"Prediction worker error: {value}")
+        return value
+    
+    @staticmethod
+    def _encode(image: Any) -> Any:
+        """
+        Convert an image to a payload the worker can decode.
+        
+        Encoded files are sent as their bytes, which is far smaller than the
+        decoded pixels; in-memory images are sent as uint8 HWC RGB arrays.
+        """
+        if isinstance(image, (bytes, bytearray)):
+            return bytes(image)
+        if isinstance(image, (str, Path)):
+            return Path(image).read_bytes()
+        if hasattr(image, 'read'):
+            return image.read()
+        if isinstance(image, Image.Image):
+            return np.asarray(image.convert('RGB'), dtype=np.uint8)
+        return np.ascontiguousarray(image, dtype=np.uint8)
@@ -7,7 +7,7 @@ preprocessing operations including resizing, normalization, and tensor conversio
 
 from typing import Tuple, List, Union
 import torch
-from torchvision import transforms
+from torchvision.transforms import v2
 from PIL import Image
 import numpy as np
 
@@ -18,7 +18,9 @@ class ImageTransformer:
     
     This class provides a consistent transformation pipeline that preprocesses
     images for the CNN model, including resizing, normalization, and conversion
-    to PyTorch tensors.
+    to PyTorch tensors. Pipelines use ``torchvision.transforms.v2`` and convert
+    to a uint8 tensor first, so resizing and augmentation run on the tensor
+    backend and the float cast/normalize happen once at the end.
     
     Attributes:
         target_size: Target dimensions (height, width) for resized images
@@ -44,43 +46,68 @@ class ImageTransformer:
         self.mean = mean
         self.std = std
         
+        # Reusable building blocks
+        self._resize = v2.Resize(self.target_size, antialias=True)
+        self._normalize = v2.Normalize(mean=self.mean, std=self.std)
+        self._to_float_tensor = v2.Compose([
+            v2.PILToTensor(),
+            v2.ToDtype(torch.float32, scale=True)
+        ])
+        
         # Create transformation pipelines
         self._inference_transforms = self._build_inference_transforms()
         self._training_transforms = self._build_training_transforms()
+        self._tensor_augmentations = self._build_tensor_augmentations()
     
-    def _build_inference_transforms(self) -> transforms.Compose:
+    def _build_inference_transforms(self) -> v2.Compose:
         """
         Build the inference transformation pipeline.
         
         Returns:
             Composed transformation pipeline for inference
         """
-        return transforms.Compose([
-            transforms.Resize(self.target_size),
-            transforms.ToTensor(),
-            transforms.Normalize(mean=self.mean, std=self.std)
+        return v2.Compose([
+            v2.PILToTensor(),
+            self._resize,
+            v2.ToDtype(torch.float32, scale=True),
+            self._normalize
         ])
     
-    def _build_training_transforms(self) -> transforms.Compose:
+    def _build_training_transforms(self) -> v2.Compose:
         """
         Build the training transformation pipeline with augmentations.
         
         Returns:
             Composed transformation pipeline for training with augmentations
         """
-        return transforms.Compose([
-            transforms.RandomResizedCrop(self.target_size, scale=(0.8, 1.0)),
-            transforms.RandomHorizontalFlip(p=0.5),
-            transforms.RandomVerticalFlip(p=0.5),
-            transforms.RandomRotation(degrees=30),
-            transforms.ColorJitter(
+        return v2.Compose([
+            v2.PILToTensor(),
+            v2.RandomResizedCrop(self.target_size, scale=(0.8, 1.0), antialias=True),
+            v2.RandomHorizontalFlip(p=0.5),
+            v2.RandomVerticalFlip(p=0.5),
+            v2.RandomRotation(degrees=30),
+            v2.ColorJitter(
                 brightness=0.3,
                 contrast=0.3,
                 saturation=0.3,
                 hue=0.1
             ),
-            transforms.ToTensor(),
-            transforms.Normalize(mean=self.mean, std=self.std)
+            v2.ToDtype(torch.float32, scale=True),
+            self._normalize
+        ])
+
+    def _build_tensor_augmentations(self) -> v2.Compose:
+        """
+        Build geometric augmentations for already preprocessed tensors.
+        
+        Returns:
+            Composed augmentation pipeline for normalized image tensors
+        """
+        return v2.Compose([
+            v2.RandomResizedCrop(self.target_size, scale=(0.8, 1.0), antialias=True),
+            v2.RandomHorizontalFlip(p=0.5),
+            v2.RandomVerticalFlip(p=0.5),
+            v2.RandomRotation(degrees=30)
         ])
 
     def transform(self, image: Union[Image.Image, np.ndarray]) -> torch.Tensor:
@@ -124,7 +151,7 @@ class ImageTransformer:
         # Apply inference transformations
         return self._inference_transforms(image)
     
-    def get_inference_transforms(self) -> transforms.Compose:
+    def get_inference_transforms(self) -> v2.Compose:
         """
         Get the inference transformation pipeline.
         
@@ -133,7 +160,7 @@ class ImageTransformer:
         """
         return self._inference_transforms
     
-    def get_training_transforms(self) -> transforms.Compose:
+    def get_training_transforms(self) -> v2.Compose:
         """
         Get the training transformation pipeline with augmentations.
         
@@ -142,6 +169,17 @@ class ImageTransformer:
         """
         return self._training_transforms
     
+    def get_tensor_augmentations(self) -> v2.Compose:
+        """
+        Get augmentations for tensors that were preprocessed ahead of time.
+        
+        Colour jitter is omitted because it expects unnormalized input.
+        
+        Returns:
+            Composed augmentation pipeline for normalized image tensors
+        """
+        return self._tensor_augmentations
+    
     def resize(self, image: Union[Image.Image, np.ndarray]) -> Image.Image:
         """
         Resize an image to target dimensions.
@@ -163,7 +201,7 @@ class ImageTransformer:
         if image.mode != 'RGB':
             image = image.convert('RGB')
             
-        return transforms.Resize(self.target_size)(image)
+        return self._resize(image)
     
     def normalize(self, tensor: torch.Tensor) -> torch.Tensor:
         """
@@ -175,7 +213,7 @@ class ImageTransformer:
         Returns:
             Normalized tensor
         """
-        return transforms.Normalize(mean=self.mean, std=self.std)(tensor)
+        return self._normalize(tensor)
     
     def to_tensor(self, image: Union[Image.Image, np.ndarray]) -> torch.Tensor:
         """
@@ -198,4 +236,4 @@ class ImageTransformer:
         if image.mode != 'RGB':
             image = image.convert('RGB')
             
-        return transforms.ToTensor()(image)
+        return self._to_float_tensor(image)
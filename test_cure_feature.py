@@ -56,30 +56,21 @@ def test_remedy_service():
     else:
         print("❌ Failed to get remedy")
     
-    # Test 3: Get remedy for Blast
-    print("\n✅ Test 3: Get remedy for Blast")
-    remedy = service.get_remedy("Blast")
-    if remedy:
-        print(f"Disease Name: {remedy.disease_name}")
-        print(f"Severity: {remedy.severity_level}")
-        print(f"Time to Cure: {remedy.time_to_cure}")
-    else:
-        print("❌ Failed to get remedy")
+    # Tests 3-5: Look up the remaining diseases in a single bulk call
+    remedies = service.get_remedies(["Blast", "Brownspot", "NonExistentDisease"])
     
-    # Test 4: Get remedy for Brown Spot
-    print("\n✅ Test 4: Get remedy for Brown Spot")
-    remedy = service.get_remedy("Brownspot")
-    if remedy:
-        print(f"Disease Name: {remedy.disease_name}")
-        print(f"Severity: {remedy.severity_level}")
-        print(f"Time to Cure: {remedy.time_to_cure}")
-    else:
-        print("❌ Failed to get remedy")
+    for test_number, (label, key) in enumerate([("Blast", "Blast"), ("Brown Spot", "Brownspot")], start=3):
+        print(f"\n✅ Test {test_number}: Get remedy for {label}")
+        remedy = remedies[key]
+        if remedy:
+            print(f"Disease Name: {remedy.disease_name}")
+            print(f"Severity: {remedy.severity_level}")
+            print(f"Time to Cure: {remedy.time_to_cure}")
+        else:
+            print("❌ Failed to get remedy")
     
-    # Test 5: Get remedy for non-existent disease
     print("\n✅ Test 5: Get remedy for non-existent disease")
-    remedy = service.get_remedy("NonExistentDisease")
-    if remedy is None:
+    if remedies["NonExistentDisease"] is None:
         print("✓ Correctly returned None for non-existent disease")
     else:
         print("❌ Should have returned None")
@@ -0,0 +1,32 @@
+"""
+Shared fixtures for the prediction tests.
+"""
+
+import json
+
+import pytest
+import torch
+import torchvision.models as models
+
+
+CLASSES = ["Bacterialblight", "Blast", "Brownspot"]
+
+
+@pytest.fixture(scope="session")
+def model_files(tmp_path_factory):
+    """Write a randomly initialised checkpoint and class names file."""
+    tmp_dir = tmp_path_factory.mktemp("model")
+
+    torch.manual_seed(0)
+    model = models.resnet18(weights=None)
+    model.fc = torch.nn.Sequential(
+        torch.nn.Dropout(0.5),
+        torch.nn.Linear(model.fc.in_features, len(CLASSES))
+    )
+    model_path = tmp_dir / "model.pth"
+    torch.save(model.state_dict(), model_path)
+
+    config_path = tmp_dir / "class_names.json"
+    config_path.write_text(json.dumps({"classes": CLASSES}))
+
+    return str(model_path), str(config_path)
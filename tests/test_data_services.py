@@ -0,0 +1,91 @@
+"""
+Tests for the user data services.
+"""
+
+import hashlib
+
+from src.services.data_services import (
+    SHA256PasswordHasher,
+    SQLiteConnection,
+    UserRepository
+)
+
+
+def test_hash_password_is_salted():
+    """Test that hashing the same password twice yields different hashes."""
+    hasher = SHA256PasswordHasher(iterations=1000)
+
+    first = hasher.hash_password("secret")
+    second = hasher.hash_password("secret")
+
+    assert first != second
+    assert first.count('$') == 2
+    assert first.split('$')[1] == '1000'
+
+
+def test_verify_password():
+    """Test that verification accepts the right password only."""
+    hasher = SHA256PasswordHasher(iterations=1000)
+
+    hashed = hasher.hash_password("secret")
+
+    assert hasher.verify_password("secret", hashed)
+    assert not hasher.verify_password("wrong", hashed)
+
+
+def test_verify_legacy_sha256_hash():
+    """Test that unsalted SHA-256 hashes from older databases still verify."""
+    hasher = SHA256PasswordHasher()
+    legacy = hashlib.sha256("secret".encode()).hexdigest()
+
+    assert hasher.verify_password("secret", legacy)
+    assert not hasher.verify_password("wrong", legacy)
+
+
+def test_verify_malformed_hash():
+    """Test that malformed hashes are rejected instead of raising."""
+    hasher = SHA256PasswordHasher()
+
+    assert not hasher.verify_password("secret", "not$a$hash")
+    assert not hasher.verify_password("secret", "a$b")
+
+
+def test_user_repository_create_and_lookup(tmp_path):
+    """Test creating a user and looking it up again."""
+    connection = SQLiteConnection(str(tmp_path / "users.db"))
+    repository = UserRepository(connection, SHA256PasswordHasher(iterations=1000))
+
+    assert not repository.user_exists("alice")
+    assert repository.get_user_by_username("alice") is None
+
+    assert repository.create_user("alice", "secret", "alice@example.com")
+    assert not repository.create_user("alice", "other")
+
+    assert repository.user_exists("alice")
+    user = repository.get_user_by_username("alice")
+    assert user['username'] == "alice"
+    assert user['email'] == "alice@example.com"
+    assert repository.get_user_count() == 1
+
+    connection.close()
+
+
+def test_user_repository_sees_users_created_elsewhere(tmp_path):
+    """Test that a lookup miss is not cached across repositories."""
+    db_path = str(tmp_path / "users.db")
+    hasher = SHA256PasswordHasher(iterations=1000)
+    first = UserRepository(SQLiteConnection(db_path), hasher)
+    second = UserRepository(SQLiteConnection(db_path), hasher)
+
+    assert second.get_user_by_username("bob") is None
+    assert first.create_user("bob", "secret")
+    assert second.get_user_by_username("bob") is not None
+
+
+def test_sqlite_connection_uses_wal(tmp_path):
+    """Test that file databases are opened in WAL mode."""
+    connection = SQLiteConnection(str(tmp_path / "users.db"))
+
+    assert connection.execute_query('PRAGMA journal_mode') == [('wal',)]
+
+    connection.close()
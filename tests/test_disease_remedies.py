@@ -0,0 +1,131 @@
+"""
+Tests for the disease remedy service.
+"""
+
+import dataclasses
+
+import pytest
+
+from src.disease_remedies import (
+    REMEDY_HTML_DIR,
+    DiseaseRemedyService,
+    RemedyStep,
+    StepTable,
+    get_remedy_html,
+    get_remedy_service,
+    render_remedy_html
+)
+
+
+def test_get_all_diseases():
+    """Test that all supported diseases are listed."""
+    service = DiseaseRemedyService()
+
+    assert list(service.get_all_diseases()) == ["Bacterialblight", "Blast", "Brownspot"]
+
+
+def test_remedies_are_built_lazily():
+    """Test that remedies are only built when first requested."""
+    service = DiseaseRemedyService()
+
+    service.get_all_diseases()
+    assert service._cache == {}
+
+    remedy = service.get_remedy("Blast")
+    assert list(service._cache) == ["Blast"]
+    assert service.get_remedy("Blast") is remedy
+
+
+def test_get_remedy():
+    """Test looking up a single remedy."""
+    service = DiseaseRemedyService()
+
+    remedy = service.get_remedy("Blast")
+
+    assert remedy.disease_name == "Rice Blast"
+    assert len(remedy.chemical_treatment) == 4
+    assert service.get_remedy("Unknown") is None
+
+
+def test_get_remedies_bulk():
+    """Test looking up several remedies in one call."""
+    service = DiseaseRemedyService()
+
+    remedies = service.get_remedies(["Bacterialblight", "Brownspot", "Unknown"])
+
+    assert remedies["Bacterialblight"] is service.get_remedy("Bacterialblight")
+    assert remedies["Brownspot"].disease_name == "Brown Spot"
+    assert remedies["Unknown"] is None
+
+
+def test_get_remedy_html():
+    """Test HTML rendering for known and unknown diseases."""
+    html = get_remedy_html("Bacterialblight")
+
+    assert "Complete Cure & Treatment Guide" in html
+    assert "<li>🚨 Isolate infected plants immediately to prevent spread</li>" in html
+    assert get_remedy_html("Unknown") == "<p>No remedy information available for this disease.</p>"
+
+
+def test_get_remedy_html_is_memoized():
+    """Test that repeat renders reuse the cached HTML."""
+    assert get_remedy_html("Blast") is get_remedy_html("Blast")
+
+
+def test_list_html_fragments_are_prerendered():
+    """Test that list fields have matching pre-rendered HTML fragments."""
+    remedy = DiseaseRemedyService().get_remedy("Brownspot")
+
+    assert remedy.dos_html == "".join(f"<li>{item}</li>" for item in remedy.dos)
+    assert remedy.donts_html.count("<li>") == len(remedy.donts)
+    assert remedy.preventive_measures_html.count("<li>") == len(remedy.preventive_measures)
+    assert remedy.immediate_actions_html in get_remedy_html("Brownspot")
+
+
+def test_step_table_behaves_like_step_list():
+    """Test that StepTable round-trips RemedySteps column-wise."""
+    steps = [RemedyStep(1, "First", "Do this", "💊"), RemedyStep(2, "Second", "Then this")]
+
+    table = StepTable.from_steps(steps)
+
+    assert len(table) == 2
+    assert list(table) == steps
+    assert table[1] == steps[1]
+    assert table.titles == ("First", "Second")
+    assert table.icons == ("💊", "📌")
+
+
+def test_prebuilt_remedy_html_is_up_to_date():
+    """Test that data/remedies matches the remedy data (re-run scripts/build_remedy_html.py)."""
+    for disease_name in DiseaseRemedyService().get_all_diseases():
+        html_path = REMEDY_HTML_DIR / f"{disease_name}.html"
+        assert html_path.read_text(encoding="utf-8") == render_remedy_html(disease_name)
+
+
+def test_remedies_are_immutable():
+    """Test that remedy data cannot be modified by callers."""
+    remedy = DiseaseRemedyService().get_remedy("Bacterialblight")
+
+    assert isinstance(remedy.immediate_actions, tuple)
+    assert isinstance(remedy.dos, tuple)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        remedy.cause = "Unknown"
+
+
+def test_unknown_disease_html_skips_cache():
+    """Test that unknown names are rejected before reaching the HTML cache."""
+    from src.disease_remedies import _load_remedy_html
+
+    before = _load_remedy_html.cache_info().currsize
+    html = get_remedy_html("../../etc/passwd")
+
+    assert html == "<p>No remedy information available for this disease.</p>"
+    assert _load_remedy_html.cache_info().currsize == before
+
+
+def test_get_remedy_service_is_shared():
+    """Test that the module hands out one service so remedies are built once."""
+    service = get_remedy_service()
+
+    assert get_remedy_service() is service
+    assert service.get_remedy("Blast") is get_remedy_service().get_remedy("Blast")
@@ -0,0 +1,342 @@
+"""
+Tests for the prediction services and predictor using an untrained checkpoint.
+"""
+
+import io
+import shutil
+
+import pytest
+import torch
+from PIL import Image
+
+from src.predictor import Predictor, get_predictor
+from src.services.prediction_services import (
+    CUDAGraphModel,
+    ImagePreprocessor,
+    JSONClassNameProvider,
+    PyTorchModelLoader,
+    StaticDiseaseInfoProvider,
+    _load_class_names_cached
+)
+from src.transforms import ImageTransformer
+from tests.conftest import CLASSES
+
+
+@pytest.fixture
+def images():
+    """Create a few solid-colour test images."""
+    return [
+        Image.new("RGB", (64, 48), color)
+        for color in ((200, 30, 30), (30, 200, 30), (30, 30, 200))
+    ]
+
+
+def test_predict_image(model_files, images):
+    """Test that a single prediction returns a well-formed result."""
+    predictor = Predictor(*model_files)
+
+    result = predictor.predict_image(images[0])
+
+    assert result['predicted_class'] in CLASSES
+    assert 0.0 <= result['confidence'] <= 100.0
+    assert list(result['all_probabilities']) == CLASSES
+    assert sum(result['all_probabilities'].values()) == pytest.approx(100.0, abs=1e-3)
+
+
+def test_get_predictor_is_cached(model_files):
+    """Test that the predictor factory reuses loaded predictors."""
+    first = get_predictor(*model_files)
+
+    assert get_predictor(*model_files) is first
+    assert first.classes == CLASSES
+
+
+def test_predict_batch_matches_single_predictions(model_files, images):
+    """Test that batched prediction agrees with per-image prediction."""
+    predictor = Predictor(*model_files)
+
+    batch_results = predictor.predict_batch(images)
+
+    assert len(batch_results) == len(images)
+    for image, batch_result in zip(images, batch_results):
+        single = predictor.predict_image(image)
+        assert batch_result['predicted_class'] == single['predicted_class']
+        assert batch_result['confidence'] == pytest.approx(single['confidence'], abs=1e-3)
+        for class_name in CLASSES:
+            assert batch_result['all_probabilities'][class_name] == pytest.approx(
+                single['all_probabilities'][class_name], abs=1e-3
+            )
+
+
+def test_predict_batch_empty(model_files):
+    """Test that an empty batch returns no results."""
+    predictor = Predictor(*model_files)
+
+    assert predictor.predict_batch([]) == []
+
+
+def test_int8_precision_matches_fp32(model_files, images):
+    """Test that int8 quantization keeps predictions close to fp32."""
+    fp32 = Predictor(*model_files, precision='fp32')
+    int8 = Predictor(*model_files, precision='int8')
+
+    for image in images:
+        expected = fp32.predict_image(image)
+        result = int8.predict_image(image)
+        for class_name in CLASSES:
+            assert result['all_probabilities'][class_name] == pytest.approx(
+                expected['all_probabilities'][class_name], abs=2.0
+            )
+
+
+def test_unknown_precision_rejected(model_files):
+    """Test that an unsupported precision raises a ValueError."""
+    with pytest.raises(ValueError):
+        Predictor(*model_files, precision='fp8')
+
+
+def test_compile_falls_back_to_trace(model_files, images, monkeypatch):
+    """Test that a failing torch.compile falls back to a traced model."""
+    def broken_compile(model, **kwargs):
+        raise RuntimeError("no compiler available")
+
+    monkeypatch.setattr(torch, "compile", broken_compile)
+    expected = Predictor(*model_files).predict_image(images[0])
+
+    predictor = Predictor(*model_files, compile_model=True)
+
+    assert isinstance(predictor.model, torch.jit.ScriptModule)
+    result = predictor.predict_image(images[0])
+    assert result['predicted_class'] == expected['predicted_class']
+    assert result['confidence'] == pytest.approx(expected['confidence'], abs=1e-3)
+
+
+def test_class_names_are_cached(model_files):
+    """Test that class names are parsed once and copied per provider."""
+    _, config_path = model_files
+    first = JSONClassNameProvider(config_path)
+    second = JSONClassNameProvider(config_path)
+
+    first.get_class_names().append("Mutated")
+
+    assert second.get_class_names() == CLASSES
+    assert _load_class_names_cached.cache_info().hits >= 1
+
+
+def test_predict_image_fast_matches_predict_image(model_files, images):
+    """Test that the fast path agrees with the service-based path."""
+    predictor = Predictor(*model_files)
+
+    for image in images + [images[0].convert("L")]:
+        expected = predictor.predict_image(image)
+        result = predictor.predict_image_fast(image)
+        assert result['predicted_class'] == expected['predicted_class']
+        assert result['confidence'] == pytest.approx(expected['confidence'], abs=1e-3)
+
+
+def test_preprocess_batch_matches_preprocess(images):
+    """Test that batch preprocessing stacks the per-image tensors."""
+    preprocessor = ImagePreprocessor(ImageTransformer())
+
+    batch = preprocessor.preprocess_batch(images)
+
+    assert batch.shape == (len(images), 3, 224, 224)
+    for i, image in enumerate(images):
+        assert torch.equal(batch[i], preprocessor.preprocess(image))
+
+
+def test_predictor_uses_slots(model_files):
+    """Test that Predictor has a fixed attribute layout."""
+    predictor = Predictor(*model_files, warmup=False)
+
+    assert not hasattr(predictor, "__dict__")
+    with pytest.raises(AttributeError):
+        predictor.unexpected = True
+
+
+@pytest.mark.parametrize("image_format", ["PNG", "JPEG"])
+def test_preprocess_accepts_encoded_bytes(images, image_format):
+    """Test that encoded image bytes decode like the equivalent file."""
+    preprocessor = ImagePreprocessor(ImageTransformer())
+    buffer = io.BytesIO()
+    images[0].save(buffer, format=image_format)
+    data = buffer.getvalue()
+
+    expected = preprocessor.preprocess(Image.open(io.BytesIO(data)).convert("RGB"))
+
+    assert torch.allclose(preprocessor.preprocess(data), expected, atol=0.1)
+
+
+def test_threaded_preprocess_batch_matches_serial(images):
+    """Test that threaded batch preprocessing keeps order and values."""
+    serial = ImagePreprocessor(ImageTransformer(), num_workers=1)
+    threaded = ImagePreprocessor(ImageTransformer(), num_workers=3)
+
+    assert torch.equal(threaded.preprocess_batch(images * 3), serial.preprocess_batch(images * 3))
+
+
+def test_amp_precision_falls_back_to_fp32_on_cpu(model_files, images):
+    """Test that autocast precision only applies on CUDA."""
+    if torch.cuda.is_available():
+        pytest.skip("checks the CPU fallback")
+
+    predictor = Predictor(*model_files, precision='amp')
+
+    assert predictor.prediction_service.autocast_dtype is None
+    expected = Predictor(*model_files, precision='fp32').predict_image(images[0])
+    assert predictor.predict_image(images[0]) == expected
+
+
+def test_cuda_graph_ignored_on_cpu(model_files, images):
+    """Test that CUDA graph capture is skipped without a GPU."""
+    if torch.cuda.is_available():
+        pytest.skip("checks the CPU fallback")
+
+    predictor = Predictor(*model_files, cuda_graph=True)
+
+    assert not isinstance(predictor.model, CUDAGraphModel)
+    assert predictor.predict_image(images[0])['predicted_class'] in CLASSES
+
+
+@pytest.mark.parametrize("image_format", ["PNG", "JPEG"])
+def test_tensor_preprocessing_matches_pil(images, image_format):
+    """Test that device-side tensor preprocessing stays close to the PIL path."""
+    buffer = io.BytesIO()
+    images[0].save(buffer, format=image_format, quality=95)
+    data = buffer.getvalue()
+
+    expected = ImagePreprocessor(ImageTransformer()).preprocess(data)
+    result = ImagePreprocessor(ImageTransformer(), device="cpu").preprocess(data)
+
+    assert result.shape == expected.shape
+    assert torch.allclose(result, expected, atol=0.1)
+
+
+def test_static_int8_quantization_is_cached(model_files, images, tmp_path):
+    """Test that calibrated int8 weights are saved and reused on reload."""
+    if torch.cuda.is_available():
+        pytest.skip("int8 quantization runs on CPU")
+
+    model_path = tmp_path / "model.pth"
+    shutil.copy(model_files[0], model_path)
+    preprocessor = ImagePreprocessor(ImageTransformer())
+    batch = preprocessor.preprocess_batch(images)
+    calls = []
+
+    def calibration_loader():
+        calls.append(1)
+        return batch
+
+    loader = PyTorchModelLoader(len(CLASSES), precision='int8', calibration_loader=calibration_loader)
+    model = loader.load_model(str(model_path))
+
+    assert (tmp_path / "model_quantized.pth").exists()
+    cached = loader.load_model(str(model_path))
+    assert len(calls) == 1
+
+    fp32 = PyTorchModelLoader(len(CLASSES), precision='fp32').load_model(str(model_path))
+    with torch.no_grad():
+        expected = fp32(batch).softmax(-1)
+        assert torch.allclose(cached(batch), model(batch))
+        assert torch.allclose(model(batch).softmax(-1), expected, atol=0.05)
+
+
+def test_disease_info_is_shared_and_read_only():
+    """Test that disease info providers share one immutable data set."""
+    first = StaticDiseaseInfoProvider()
+    second = StaticDiseaseInfoProvider()
+
+    assert first.disease_data is second.disease_data
+    assert first.get_all_diseases() == tuple(CLASSES)
+    assert first.get_disease_info("Unknown") is second.get_disease_info("Other")
+    with pytest.raises(TypeError):
+        first.get_disease_info("Blast")['symptoms'] = 'N/A'
+
+
+def test_model_uses_channels_last(model_files):
+    """Test that loaded convolution weights use the NHWC memory format."""
+    model = PyTorchModelLoader(len(CLASSES), precision='fp32').load_model(model_files[0])
+
+    assert model.conv1.weight.is_contiguous(memory_format=torch.channels_last)
+
+
+def test_predict_without_probabilities(model_files, images):
+    """Test that skipping the probability breakdown keeps label and confidence."""
+    predictor = Predictor(*model_files)
+
+    for image in images:
+        expected = predictor.predict_image(image)
+        result = predictor.predict_image(image, return_probabilities=False)
+        assert 'all_probabilities' not in result
+        assert result['predicted_class'] == expected['predicted_class']
+        assert result['confidence'] == pytest.approx(expected['confidence'], abs=1e-3)
+
+
+def test_model_is_built_without_initialising_weights(model_files):
+    """Test that the architecture is built on the meta device and fully loaded."""
+    loader = PyTorchModelLoader(len(CLASSES), precision='fp32', warmup=False)
+
+    assert all(p.is_meta for p in loader._build_model().parameters())
+
+    first = loader.load_model(model_files[0])
+    second = loader.load_model(model_files[0])
+
+    assert not any(t.is_meta for t in list(first.parameters()) + list(first.buffers()))
+    assert first.fc[1].weight.data_ptr() != second.fc[1].weight.data_ptr()
+    assert torch.equal(first.fc[1].weight, second.fc[1].weight)
+
+
+def test_frozen_model_matches_eager(model_files, images):
+    """Test that the scripted and frozen model predicts like the eager one."""
+    expected = Predictor(*model_files, precision='fp32')
+    predictor = Predictor(*model_files, precision='fp32', freeze=True)
+
+    assert isinstance(predictor.model, torch.jit.ScriptModule)
+    for image in images:
+        result = predictor.predict_image(image)
+        reference = expected.predict_image(image)
+        assert result['predicted_class'] == reference['predicted_class']
+        assert result['confidence'] == pytest.approx(reference['confidence'], abs=1e-3)
+
+
+def test_loader_warmup_can_be_disabled(model_files, monkeypatch):
+    """Test that the load-time warm-up runs on the returned model unless disabled."""
+    calls = []
+    monkeypatch.setattr(PyTorchModelLoader, "_warmup", lambda self, model: calls.append(model))
+
+    PyTorchModelLoader(len(CLASSES), warmup=False).load_model(model_files[0])
+    assert calls == []
+
+    model = PyTorchModelLoader(len(CLASSES)).load_model(model_files[0])
+    assert calls == [model]
+
+
+def test_cpu_model_survives_checkpoint_rewrite(model_files, tmp_path):
+    """Test that CPU weights do not stay backed by the checkpoint file."""
+    if torch.cuda.is_available():
+        pytest.skip("checks the CPU load path")
+
+    model_path = tmp_path / "model.pth"
+    shutil.copy(model_files[0], model_path)
+    model = PyTorchModelLoader(len(CLASSES), precision='fp32', warmup=False).load_model(str(model_path))
+    expected = model.fc[1].weight.clone()
+
+    model_path.write_bytes(b"")
+
+    assert torch.equal(model.fc[1].weight, expected)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="needs a CUDA device")
+def test_cuda_preprocessing_of_pil_images_matches_cpu(images):
+    """Test that PIL images uploaded through pinned memory preprocess like on CPU."""
+    expected = ImagePreprocessor(ImageTransformer()).preprocess(images[0])
+    result = ImagePreprocessor(ImageTransformer(), device="cuda").preprocess(images[0])
+
+    assert result.is_cuda
+    assert torch.allclose(result.cpu(), expected, atol=0.1)
+
+
+def test_preprocess_batch_rejects_empty_list():
+    """Test that an empty batch is rejected explicitly rather than by IndexError."""
+    with pytest.raises(ValueError):
+        ImagePreprocessor(ImageTransformer()).preprocess_batch([])
@@ -0,0 +1,64 @@
+"""
+Tests for serving predictions from a background worker process.
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+from src.predictor import Predictor
+from src.services.prediction_worker import PredictionWorker
+from tests.conftest import CLASSES
+
+
+@pytest.fixture(scope="module")
+def worker(model_files):
+    """Start a worker process for the test checkpoint."""
+    worker = PredictionWorker(*model_files, precision='fp32', warmup=False)
+    worker.start(timeout=120)
+    yield worker
+    worker.stop()
+
+
+def test_remote_predictions_match_local(model_files, worker):
+    """Test that the worker returns the same results as an in-process predictor."""
+    local = Predictor(*model_files, precision='fp32', warmup=False)
+    image = Image.new("RGB", (64, 48), (200, 30, 30))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+
+    client = worker.connect()
+    try:
+        expected = local.predict_image(image)
+        for payload in (image, buffer.getvalue()):
+            result = client.predict(payload)
+            assert result['predicted_class'] == expected['predicted_class']
+            assert result['confidence'] == pytest.approx(expected['confidence'], abs=1e-3)
+
+        batch = client.predict_batch([image, image])
+        assert [r['predicted_class'] for r in batch] == [expected['predicted_class']] * 2
+    finally:
+        client.close()
+
+
+def test_remote_errors_are_raised(worker):
+    """Test that failures in the worker surface as RuntimeError in the client."""
+    client = worker.connect()
+    try:
+        with pytest.raises(RuntimeError):
+            client.predict(b"not an image")
+        # The connection stays usable after an error
+        image = Image.new("RGB", (64, 48), (30, 200, 30))
+        assert client.predict(image)['predicted_class'] in CLASSES
+    finally:
+        client.close()
+
+
+def test_worker_reports_load_failure(tmp_path):
+    """Test that a worker that cannot load its model fails to start."""
+    worker = PredictionWorker(str(tmp_path / "missing.pth"), str(tmp_path / "missing.json"))
+
+    with pytest.raises(RuntimeError):
+        worker.start(timeout=120)
+    assert not worker.is_alive()
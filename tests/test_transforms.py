@@ -221,3 +221,15 @@ def test_transform_real_disease_image():
     # Check that the image was actually loaded (not all zeros or all ones)
     assert not torch.all(result == 0)
     assert not torch.all(result == 1)
+
+
+def test_tensor_augmentations_on_preprocessed_tensor():
+    """Test that tensor augmentations keep the shape of preprocessed images."""
+    transformer = ImageTransformer(target_size=(224, 224))
+    
+    tensor = transformer.transform(Image.new('RGB', (100, 100), color='red'))
+    result = transformer.get_tensor_augmentations()(tensor)
+    
+    assert isinstance(result, torch.Tensor)
+    assert result.shape == (3, 224, 224)
+    assert result.dtype == torch.float32